@@ -1,3 +1,52 @@
+from array import array
+
+# 扩容策略
+class GrowthPolicy:
+    """
+    动态数组的扩容/缩容策略
+    - factor：乘法扩容因子，如1.5、2
+    - increment：加法扩容步长，非0时代替乘法扩容
+    - shrink_at：占用率低于该值时缩容，0表示不自动缩容
+    
+    缩容时容量按同样的因子（或步长）缩小，只要shrink_at小于1/factor，
+    缩容后占用率就落在(shrink_at, 1)之间，形成滞回区间，避免在扩容和缩容之间反复抖动
+    因此shrink_at必须在[0, 1/factor)内；加法扩容时必须在[0, 1)内
+    默认策略与原实现一致：满了翻倍，占用率低于1/4时减半
+    """
+    def __init__(self, factor=2, increment=0, shrink_at=0.25):
+        if increment <= 0 and factor <= 1:
+            raise ValueError("growth factor must be greater than 1")
+        limit = 1 if increment > 0 else 1 / factor
+        if not 0 <= shrink_at < limit:
+            raise ValueError("shrink_at must be in [0, %g)" % limit)
+        self.factor = factor
+        self.increment = increment
+        self.shrink_at = shrink_at
+        
+    def grow(self, capacity, required):
+        """返回扩容后的容量，保证不小于required"""
+        if self.increment > 0:
+            new_capacity = capacity + self.increment
+        else:
+            new_capacity = int(capacity * self.factor)
+        return max(new_capacity, required, capacity + 1)
+    
+    def shrink(self, capacity, size):
+        """返回缩容后的容量，无需缩容时返回None"""
+        if size == 0 or size >= capacity * self.shrink_at:
+            return None
+        
+        # 批量删除后可能需要连续缩小多次
+        while size < capacity * self.shrink_at:
+            if self.increment > 0:
+                new_capacity = capacity - self.increment
+            else:
+                new_capacity = int(capacity / self.factor)
+            if new_capacity < size or new_capacity < 1:
+                break
+            capacity = new_capacity
+        return capacity
+
 # 动态数组实现
 class DynamicArray:
     """
@@ -7,52 +56,130 @@ class DynamicArray:
     - 插入末尾 O(1) 摊还
     - 插入任意位置 O(n)
     - 删除 O(n)
+    - 批量插入/删除 O(n + k) 尾部只整体移动一次
+    
+    扩容/缩容规则由GrowthPolicy决定，resize_count和copied_elements记录调整次数与复制量
+    
+    存储模式：
+    - typecode=None：底层为list，可存放任意对象
+    - typecode='d'/'q'/'i'/'B'等：底层为array模块的紧凑数组，支持缓冲区协议
+    
+    每个元素的内存占用（10^6个元素，tracemalloc实测）：
+    - list存float：约32字节（8字节指针 + 24字节float对象）
+    - list存int：约40字节（8字节指针 + int对象）
+    - typecode='d'/'q'：8字节；typecode='i'：4字节
     """
-    def __init__(self,initial_capacity=10):
+    def __init__(self,initial_capacity=10, typecode=None, growth_policy=None):
         self.capacity = initial_capacity # 数组容量
         self.size = 0 # 元素当前个数
-        self.data = [None] * self.capacity # 底层数组
+        self.growth_policy = growth_policy or GrowthPolicy() # 扩容/缩容策略
+        self.resize_count = 0 # 扩容/缩容次数
+        self.copied_elements = 0 # 扩容/缩容时复制的元素总数
+        self.typecode = typecode # 类型码，None表示list存储
+        self.itemsize = 8 if typecode is None else array(typecode).itemsize # 每个槽位的字节数（list模式为指针大小）
+        self._empty = None if typecode is None else array(typecode, bytes(self.itemsize))[0] # 空槽位的填充值
+        self.data = self._new_storage(self.capacity) # 底层数组
+        
+    def _new_storage(self, capacity):
+        """按存储模式分配底层数组"""
+        if self.typecode is None:
+            return [None] * capacity
+        # 用全零字节初始化，避免先构造list再转换
+        return array(self.typecode, bytes(self.itemsize * capacity))
+    
+    def as_memoryview(self):
+        """
+        以memoryview形式导出有效元素，不发生复制
+        仅typed模式可用；扩容后旧的视图仍指向旧缓冲区
+        """
+        if self.typecode is None:
+            raise TypeError("list-backed DynamicArray does not support the buffer protocol")
+        return memoryview(self.data)[:self.size]
+    
+    def __buffer__(self, flags):
+        """缓冲区协议（Python 3.12+），支持memoryview(arr)直接调用"""
+        return self.as_memoryview()
         
     def __len__(self):
         """返回数组长度"""
         return self.size
     
-    def getitem(self, index):
-        """"支持下标访问"""
+    def __getitem__(self, index):
+        """支持下标访问和切片，切片返回同存储模式、同扩容策略的新DynamicArray"""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.size)
+            result = DynamicArray(max(len(range(start, stop, step)), 1), self.typecode, self.growth_policy)
+            result.extend(self.data[start:stop:step])
+            return result
+        
         if not 0 <= index < self.size:
-            raise IndexError(f"Index {index} out of range [0, {self.capatiy})")
+            raise IndexError(f"Index {index} out of range [0, {self.size})")
         return self.data[index]
     
-    def setitem(self, index, value):
-        """支持下标赋值"""
+    def __setitem__(self, index, value):
+        """支持下标赋值和切片赋值"""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.size)
+            if step == 1:
+                # 连续切片允许长度变化，等价于删除后插入，只移动一次尾部
+                self._replace(start, max(start, stop), value)
+                return
+            
+            # 扩展切片要求长度一致
+            values = self._to_storage(value)
+            if len(values) != len(range(start, stop, step)):
+                raise ValueError("attempt to assign sequence of wrong size to extended slice")
+            self.data[start:stop:step] = values
+            return
+        
         if not 0 <= index < self.size:
             raise IndexError(f"Index {index} out of range [0, {self.size})")
         self.data[index] = value
         
+    def __iter__(self):
+        """按顺序遍历有效元素"""
+        for i in range(self.size):
+            yield self.data[i]
+        
     def append(self, value):
         """在末尾添加元素"""
-        # 如果容量满了，扩容为原来的两倍
+        # 如果容量满了，按扩容策略扩容
         if self.size == self.capacity:
-            self._resize(2 * self.capacity)
+            self._grow_to(self.size + 1)
         
-        self.data[self.size] == value
+        self.data[self.size] = value
         self.size += 1
         
+    def extend(self, iterable):
+        """
+        在末尾批量添加元素
+        时间复杂度：O(k) 最多扩容一次
+        """
+        self._replace(self.size, self.size, iterable)
+        
     def insert(self, index, value):
         """在指定位置插入元素"""
         if not 0 <= index <= self.size:
-            raise IndexError(f"Index {index} out of range [0, {self.size})")
+            raise IndexError(f"Index {index} out of range [0, {self.size}]")
         
         # 容量检查
         if self.size == self.capacity:
-            self._resize(2 * self.capacity)
+            self._grow_to(self.size + 1)
             
-        # 将index及之后一位的元素后移一位
-        for i in range(self.size, index ,-1):
-            self.data[i] = self.data[i+1]
+        # 将index及之后的元素整体后移一位
+        self.data[index + 1:self.size + 1] = self.data[index:self.size]
             
-        self.data[index-1] = value
+        self.data[index] = value
         self.size += 1
+        
+    def insert_many(self, index, iterable):
+        """
+        在指定位置批量插入元素
+        时间复杂度：O(n + k) 尾部只移动一次
+        """
+        if not 0 <= index <= self.size:
+            raise IndexError(f"Index {index} out of range [0, {self.size}]")
+        self._replace(index, index, iterable)
    
     def remove(self, index):
         """移除指定位置的元素"""
@@ -61,32 +188,381 @@ class DynamicArray:
         
         removed_value = self.data[index]
         
-        # 将index之后的元素前移一位
-        for i in range(index, self.size-1):
-            self.data[i] = self.data[i+1]
+        # 将index之后的元素整体前移一位
+        self.data[index:self.size - 1] = self.data[index + 1:self.size]
             
         self.size -= 1
-        self.data[self.size] = None # 防止内存泄漏
+        self.data[self.size] = self._empty # 防止内存泄漏
         
-        if self.size > 0 and self.size < self.capacity // 4:
-            self._resize(self.capacity // 2)
+        self._maybe_shrink()
         
         return removed_value
     
+    def delete_slice(self, start, stop):
+        """
+        删除区间[start, stop)内的元素
+        时间复杂度：O(n) 尾部只移动一次
+        """
+        if not 0 <= start <= stop <= self.size:
+            raise IndexError(f"Slice [{start}, {stop}) out of range [0, {self.size}]")
+        self._replace(start, stop, ())
+        
+        self._maybe_shrink()
+    
+    def _to_storage(self, values):
+        """将任意可迭代对象转换为与底层数组同类型的序列"""
+        if self.typecode is None:
+            return values if isinstance(values, list) else list(values)
+        if isinstance(values, array) and values.typecode == self.typecode:
+            return values
+        return array(self.typecode, values)
+    
+    def _replace(self, start, stop, values):
+        """用values替换区间[start, stop)，扩容至多一次、尾部移动一次"""
+        values = self._to_storage(values)
+        k = len(values)
+        new_size = self.size - (stop - start) + k
+        
+        if new_size > self.capacity:
+            self._grow_to(new_size)
+        
+        # 尾部整体移动到新位置（右侧切片先复制，重叠也安全）
+        self.data[start + k:new_size] = self.data[stop:self.size]
+        self.data[start:start + k] = values
+        
+        # 元素变少时清空尾部空出的槽位，防止内存泄漏
+        if new_size < self.size:
+            self.data[new_size:self.size] = self._new_storage(self.size - new_size)
+        
+        self.size = new_size
+    
+    def reserve(self, n):
+        """
+        预留至少n个元素的容量，之后n次以内的添加不再扩容
+        时间复杂度：O(n)
+        """
+        if n > self.capacity:
+            self._resize(n)
+    
+    def shrink_to_fit(self):
+        """
+        将容量收缩到当前元素个数
+        时间复杂度：O(n)
+        """
+        if self.capacity > max(self.size, 1):
+            self._resize(max(self.size, 1))
+    
+    def _grow_to(self, required):
+        """按扩容策略扩容，保证容量不小于required"""
+        self._resize(self.growth_policy.grow(self.capacity, required))
+    
+    def _maybe_shrink(self):
+        """按缩容策略检查是否需要缩容"""
+        new_capacity = self.growth_policy.shrink(self.capacity, self.size)
+        if new_capacity is not None and new_capacity < self.capacity:
+            self._resize(new_capacity)
+    
     def _resize(self, new_capacity):
         """调整数组容量"""
-        new_data = [None] * new_capacity
-        # 复制原有数据
-        for i in range(self.size):
-            new_data[i] = self.data[i]
+        new_data = self._new_storage(new_capacity)
+        # 切片整体复制原有数据
+        new_data[:self.size] = self.data[:self.size]
             
         self.data = new_data
         self.capacity = new_capacity
+        self.resize_count += 1
+        self.copied_elements += self.size
         
     def __str__(self):
         """字符串表示"""
         return str([self.data[i] for i in range(self.size)])
     
+# 间隙缓冲区
+class GapBuffer:
+    """
+    间隙缓冲区：接口与DynamicArray相同，底层数组中保留一段可移动的空隙
+    在光标附近连续插入/删除时只需移动空隙，无需整体移动尾部
+    时间复杂度：
+    - 访问 O(1)
+    - 在空隙处插入/删除 O(1) 摊还
+    - 在任意位置插入/删除 O(min(d, n)) d为与上次编辑位置的距离
+    
+    布局：data[0:gap_start]为前半部分元素，data[gap_end:capacity]为后半部分元素
+    
+    list存储时移动空隙要逐个复制并清空元素引用，每个元素比list.insert/del的整体memmove贵约30倍，
+    因此远离空隙的编辑先直接在底层list上插入/删除，空隙留在原处；
+    这些原地编辑累计的memmove量超过移动空隙的代价后才把空隙移过去，
+    随机编辑的总代价不超过全部原地编辑的约2倍，编辑集中到新位置后又回到O(1)
+    typed存储总是移动空隙
+    扩容/缩容规则由GrowthPolicy决定，与DynamicArray相同
+    """
+    _MOVE_COST = 32 # list存储时移动空隙每个元素的代价，以memmove一个槽位为单位
+    
+    def __init__(self, initial_capacity=10, typecode=None, growth_policy=None):
+        self.capacity = max(initial_capacity, 1) # 数组容量
+        self.growth_policy = growth_policy or GrowthPolicy() # 扩容/缩容策略
+        self.resize_count = 0 # 扩容/缩容次数
+        self.copied_elements = 0 # 扩容/缩容时复制的元素总数
+        self.typecode = typecode # 类型码，None表示list存储
+        self.itemsize = 8 if typecode is None else array(typecode).itemsize
+        self._empty = None if typecode is None else array(typecode, bytes(self.itemsize))[0]
+        self.data = self._new_storage(self.capacity) # 底层数组
+        self.gap_start = 0 # 空隙起点
+        self.gap_end = self.capacity # 空隙终点（不含）
+        self._in_place_cost = 0 # 上次移动空隙以来原地编辑累计memmove的槽位数
+    
+    @property
+    def size(self):
+        """元素当前个数"""
+        return self.capacity - (self.gap_end - self.gap_start)
+    
+    def __len__(self):
+        """返回元素个数"""
+        return self.size
+    
+    # 存储模式与DynamicArray相同，直接复用其分配与转换方法
+    _new_storage = DynamicArray._new_storage
+    _to_storage = DynamicArray._to_storage
+    
+    def as_memoryview(self):
+        """
+        以memoryview形式导出有效元素，先把空隙移到末尾使元素连续，时间复杂度O(d)
+        仅typed模式可用；之后的编辑会移动空隙，视图内容随之失效
+        """
+        if self.typecode is None:
+            raise TypeError("list-backed GapBuffer does not support the buffer protocol")
+        self.move_gap(self.size)
+        return memoryview(self.data)[:self.size]
+    
+    def __buffer__(self, flags):
+        """缓冲区协议（Python 3.12+），支持memoryview(buf)直接调用"""
+        return self.as_memoryview()
+    
+    def _physical(self, index):
+        """逻辑下标转换为底层数组下标"""
+        if index < self.gap_start:
+            return index
+        return index + self.gap_end - self.gap_start
+    
+    def _edit_in_place(self, index):
+        """
+        判断index处的编辑是否直接在底层list上进行（memmove其后的所有槽位），否则把空隙移过去
+        选择原地编辑时记下其代价，累计超过移动空隙的代价后改为移动空隙
+        """
+        if self.typecode is not None:
+            return False
+        move_cost = abs(index - self.gap_start) * self._MOVE_COST
+        in_place_cost = self.capacity - self._physical(index)
+        if move_cost <= in_place_cost:
+            return False
+        self._in_place_cost += in_place_cost
+        if self._in_place_cost >= move_cost:
+            self._in_place_cost = 0
+            return False
+        return True
+    
+    def __getitem__(self, index):
+        """支持下标访问和切片，切片返回同存储模式、同扩容策略的新GapBuffer"""
+        if isinstance(index, slice):
+            values = list(self)[index] if self.typecode is None else array(self.typecode, self)[index]
+            result = GapBuffer(len(values) + 1, self.typecode, self.growth_policy)
+            result.extend(values)
+            return result
+        
+        if not 0 <= index < self.size:
+            raise IndexError(f"Index {index} out of range [0, {self.size})")
+        return self.data[self._physical(index)]
+    
+    def __setitem__(self, index, value):
+        """支持下标赋值和切片赋值"""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.size)
+            if step == 1:
+                # 连续切片允许长度变化，等价于删除后插入
+                self._replace(start, max(start, stop), value)
+                self._maybe_shrink()
+                return
+            
+            # 扩展切片要求长度一致，逐个写入
+            values = self._to_storage(value)
+            positions = range(start, stop, step)
+            if len(values) != len(positions):
+                raise ValueError("attempt to assign sequence of wrong size to extended slice")
+            for i, v in zip(positions, values):
+                self.data[self._physical(i)] = v
+            return
+        
+        if not 0 <= index < self.size:
+            raise IndexError(f"Index {index} out of range [0, {self.size})")
+        self.data[self._physical(index)] = value
+    
+    def __iter__(self):
+        """按顺序遍历有效元素，跳过空隙"""
+        for i in range(self.gap_start):
+            yield self.data[i]
+        for i in range(self.gap_end, self.capacity):
+            yield self.data[i]
+    
+    def move_gap(self, index):
+        """
+        将空隙移动到逻辑下标index处
+        时间复杂度：O(d) d为移动距离
+        """
+        gap = self.gap_end - self.gap_start
+        if index < self.gap_start:
+            # 空隙左移：把[index, gap_start)搬到空隙右侧
+            n = self.gap_start - index
+            self.data[self.gap_end - n:self.gap_end] = self.data[index:self.gap_start]
+            self.gap_start = index
+            self.gap_end -= n
+            # 新空隙开头的min(n, gap)个槽位仍引用旧元素，清空以防止内存泄漏
+            cleared = min(n, gap)
+            self.data[index:index + cleared] = self._new_storage(cleared)
+        elif index > self.gap_start:
+            # 空隙右移：把空隙右侧的n个元素搬到空隙左侧
+            n = index - self.gap_start
+            self.data[self.gap_start:index] = self.data[self.gap_end:self.gap_end + n]
+            self.gap_start = index
+            self.gap_end += n
+            # 新空隙末尾的min(n, gap)个槽位仍引用旧元素，清空以防止内存泄漏
+            cleared = min(n, gap)
+            self.data[self.gap_end - cleared:self.gap_end] = self._new_storage(cleared)
+    
+    def _ensure_gap(self, k):
+        """保证空隙长度不小于k，不足时按扩容策略扩容"""
+        if self.gap_end - self.gap_start < k:
+            self._resize(self.growth_policy.grow(self.capacity, self.size + k))
+    
+    def _resize(self, new_capacity):
+        """调整数组容量，前后两段分别切片复制，空隙留在原位置"""
+        new_data = self._new_storage(new_capacity)
+        tail = self.capacity - self.gap_end
+        new_data[:self.gap_start] = self.data[:self.gap_start]
+        new_data[new_capacity - tail:] = self.data[self.gap_end:]
+        
+        self.data = new_data
+        self.gap_end = new_capacity - tail
+        self.capacity = new_capacity
+        self.resize_count += 1
+        self.copied_elements += self.size
+    
+    def _maybe_shrink(self):
+        """按缩容策略检查是否需要缩容"""
+        new_capacity = self.growth_policy.shrink(self.capacity, self.size)
+        if new_capacity is not None and new_capacity < self.capacity:
+            self._resize(new_capacity)
+    
+    def reserve(self, n):
+        """
+        预留至少n个元素的容量
+        时间复杂度：O(n)
+        """
+        if n > self.capacity:
+            self._resize(n)
+    
+    def shrink_to_fit(self):
+        """
+        将容量收缩到当前元素个数
+        时间复杂度：O(n)
+        """
+        if self.capacity > max(self.size, 1):
+            self._resize(max(self.size, 1))
+    
+    def append(self, value):
+        """在末尾添加元素"""
+        self.insert(self.size, value)
+    
+    def extend(self, iterable):
+        """在末尾批量添加元素"""
+        self.insert_many(self.size, iterable)
+    
+    def insert(self, index, value):
+        """在指定位置插入元素"""
+        if not 0 <= index <= self.size:
+            raise IndexError(f"Index {index} out of range [0, {self.size}]")
+        
+        if self._edit_in_place(index):
+            self.data.insert(self._physical(index), value)
+            self.capacity += 1
+            if index < self.gap_start:
+                self.gap_start += 1
+                self.gap_end += 1
+            return
+        
+        self._ensure_gap(1)
+        self.move_gap(index)
+        self.data[self.gap_start] = value
+        self.gap_start += 1
+    
+    def insert_many(self, index, iterable):
+        """在指定位置批量插入元素"""
+        if not 0 <= index <= self.size:
+            raise IndexError(f"Index {index} out of range [0, {self.size}]")
+        self._replace(index, index, iterable)
+    
+    def remove(self, index):
+        """移除指定位置的元素"""
+        if not 0 <= index < self.size:
+            raise IndexError(f"Index {index} out of range [0, {self.size})")
+        
+        if self._edit_in_place(index):
+            removed_value = self.data.pop(self._physical(index))
+            self.capacity -= 1
+            if index < self.gap_start:
+                self.gap_start -= 1
+                self.gap_end -= 1
+        else:
+            # 把空隙移到被删元素之前，再把空隙向右扩展一格
+            self.move_gap(index)
+            removed_value = self.data[self.gap_end]
+            self.data[self.gap_end] = self._empty # 防止内存泄漏
+            self.gap_end += 1
+        
+        self._maybe_shrink()
+        return removed_value
+    
+    def delete_slice(self, start, stop):
+        """删除区间[start, stop)内的元素"""
+        if not 0 <= start <= stop <= self.size:
+            raise IndexError(f"Slice [{start}, {stop}) out of range [0, {self.size}]")
+        self._replace(start, stop, ())
+        self._maybe_shrink()
+    
+    def _replace(self, start, stop, values):
+        """用values替换区间[start, stop)"""
+        values = self._to_storage(values)
+        k = len(values)
+        
+        # 区间整体在空隙一侧且离空隙较远时，直接替换底层list中的对应切片
+        if (stop <= self.gap_start or start > self.gap_start) and self._edit_in_place(start):
+            p = self._physical(start)
+            self.data[p:p + stop - start] = values
+            delta = k - (stop - start)
+            self.capacity += delta
+            if start < self.gap_start:
+                self.gap_start += delta
+                self.gap_end += delta
+            return
+        
+        # 否则把空隙移到start，空隙向右吞掉被替换的元素，再在空隙处写入values
+        self.move_gap(start)
+        removed = stop - start
+        self.data[self.gap_end:self.gap_end + removed] = self._new_storage(removed)
+        self.gap_end += removed
+        self._ensure_gap(k)
+        self.data[self.gap_start:self.gap_start + k] = values
+        self.gap_start += k
+    
+    def __str__(self):
+        """字符串表示"""
+        return str(list(self))
+    
+# ASCII字节处理表：大写转小写、非字母数字字节（含全部非ASCII字节）、每个字节归一化后的值（-1表示跳过）
+_ASCII_LOWER = bytes.maketrans(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ', b'abcdefghijklmnopqrstuvwxyz')
+_ASCII_NON_ALNUM = bytes(c for c in range(256) if not (c < 128 and chr(c).isalnum()))
+_ASCII_LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+_ASCII_FOLD = [_ASCII_LOWER[c] if c < 128 and chr(c).isalnum() else -1 for c in range(256)]
+
 # 字符串算法基础
 class StringAlgorithms:
     """字符串基础算法集合"""
@@ -122,7 +598,7 @@ class StringAlgorithms:
         cleaned = ''.join(c.lower() for c in s if c.isalnum())
         
         # 双指针判断
-        left, right = 0, len(s)-1,
+        left, right = 0, len(cleaned)-1
         while left < right:
             if cleaned[left] != cleaned[right]:
                 return False
@@ -130,6 +606,123 @@ class StringAlgorithms:
             right -=1
         return True
     
+    @staticmethod
+    def is_palindrome_inplace(s):
+        """
+        判断是否为回文串 - 双指针原地跳过非字母数字字符，不构造清洗后的副本
+        支持str以及bytes、memoryview、mmap等按字节访问的输入（按ASCII处理）
+        时间复杂度：O(n)
+        空间复杂度：O(1)
+        """
+        if not isinstance(s, str):
+            s = StringAlgorithms._as_sequence(s)
+            fold = _ASCII_FOLD
+            keep = lambda c: fold[c] >= 0
+            norm = fold.__getitem__
+        else:
+            keep = str.isalnum
+            norm = str.lower
+        
+        left, right = 0, len(s) - 1
+        while left < right:
+            # 两端各自跳过非字母数字字符
+            while left < right and not keep(s[left]):
+                left += 1
+            while left < right and not keep(s[right]):
+                right -= 1
+            if norm(s[left]) != norm(s[right]):
+                return False
+            left += 1
+            right -= 1
+        return True
+    
+    @staticmethod
+    def is_palindrome_iter(forward, backward):
+        """
+        判断是否为回文串 - 基于双端迭代器
+        forward从头到尾、backward从尾到头产出同一序列的字符，如iter(s)和reversed(s)
+        时间复杂度：O(n)
+        空间复杂度：O(1)
+        """
+        from itertools import zip_longest
+        
+        front = (c.lower() for c in forward if c.isalnum())
+        back = (c.lower() for c in backward if c.isalnum())
+        sentinel = object()
+        for a, b in zip_longest(front, back, fillvalue=sentinel):
+            if a != b:
+                return False
+        return True
+    
+    @staticmethod
+    def is_palindrome_chunked(data, chunk_size=1 << 16):
+        """
+        判断是否为回文串 - 从两端按块读取，适合大文件
+        data可以是str、bytes、memoryview、mmap或可seek的二进制文件对象
+        字节数据按ASCII处理（非ASCII字节视为非字母数字），每块的过滤和转小写由bytes.translate完成
+        时间复杂度：O(n)
+        空间复杂度：O(chunk_size)
+        """
+        front = StringAlgorithms._cleaned_chunks(data, chunk_size, reverse=False)
+        back = StringAlgorithms._cleaned_chunks(data, chunk_size, reverse=True)
+        
+        a = b = '' if isinstance(data, str) else b''
+        while True:
+            while not a:
+                a = next(front, None)
+                # 两个方向清洗后总长度相同，正向读完即全部匹配
+                if a is None:
+                    return True
+            while not b:
+                b = next(back)
+            k = min(len(a), len(b))
+            if a[:k] != b[:k]:
+                return False
+            a, b = a[k:], b[k:]
+    
+    @staticmethod
+    def reverse_chunks(data, chunk_size=1 << 16):
+        """
+        流式反转：从尾到头产出反转后的块，拼接起来即为反转结果
+        data可以是str、bytes、memoryview、mmap或可seek的二进制文件对象
+        时间复杂度：O(n)
+        空间复杂度：O(chunk_size)
+        """
+        for chunk in StringAlgorithms._raw_chunks(data, chunk_size, reverse=True):
+            yield chunk[::-1]
+    
+    @staticmethod
+    def _raw_chunks(data, chunk_size, reverse):
+        """按块读取原始数据，reverse为True时从尾部开始"""
+        if hasattr(data, '__getitem__'):
+            n = len(data)
+            read = lambda start, stop: data[start:stop]
+        else:
+            # 可seek的文件对象
+            n = data.seek(0, 2)
+            def read(start, stop):
+                data.seek(start)
+                return data.read(stop - start)
+        
+        starts = range(0, n, chunk_size)
+        for start in (reversed(starts) if reverse else starts):
+            chunk = read(start, min(start + chunk_size, n))
+            yield bytes(chunk) if isinstance(chunk, memoryview) else chunk
+    
+    @staticmethod
+    def _cleaned_chunks(data, chunk_size, reverse):
+        """按块读取并过滤非字母数字、转小写，reverse为True时块内也反转"""
+        for chunk in StringAlgorithms._raw_chunks(data, chunk_size, reverse):
+            if isinstance(chunk, str):
+                if chunk.isascii():
+                    # ASCII快速路径：转成字节后用translate一次完成过滤
+                    chunk = chunk.encode('ascii').translate(_ASCII_LOWER, _ASCII_NON_ALNUM).decode('ascii')
+                else:
+                    chunk = ''.join(c for c in chunk if c.isalnum()).lower()
+            else:
+                chunk = chunk.translate(_ASCII_LOWER, _ASCII_NON_ALNUM)
+            yield chunk[::-1] if reverse else chunk
+    
     @staticmethod
     def longest_common_prefix(strs):
         """
@@ -144,11 +737,71 @@ class StringAlgorithms:
         for i in range(len(strs[0])):
             char = strs[0][i]
             for j in range(1, len(strs)):
-                if i >= len(strs[j]) or char != str[j][i]:
+                if i >= len(strs[j]) or char != strs[j][i]:
                     return strs[0][:i]
         
         return strs[0]
     
+    @staticmethod
+    def longest_common_prefix_minmax(strs):
+        """
+        最长公共前缀 - 极值比较法
+        字典序最小和最大的两个字符串的公共前缀就是所有字符串的公共前缀
+        时间复杂度：O(n*m) 由C实现的min/max完成，Python层只比较两个字符串
+        空间复杂度：O(1)
+        """
+        if not strs:
+            return ""
+        
+        lo, hi = min(strs), max(strs)
+        return lo[:StringAlgorithms._common_prefix_length(lo, hi)]
+    
+    @staticmethod
+    def longest_common_prefix_binary(strs):
+        """
+        最长公共前缀 - 对前缀长度二分，用startswith批量验证
+        时间复杂度：O(n*m*log(m))
+        空间复杂度：O(m)
+        """
+        if not strs:
+            return ""
+        
+        shortest = min(strs, key=len)
+        lo, hi = 0, len(shortest)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            prefix = shortest[:mid]
+            if all(s.startswith(prefix) for s in strs):
+                lo = mid
+            else:
+                hi = mid - 1
+        return shortest[:lo]
+    
+    @staticmethod
+    def longest_common_prefix_auto(strs):
+        """
+        最长公共前缀 - 按输入规模自动选择策略
+        字符串很少时纵向扫描最快，否则使用极值比较法
+        """
+        if len(strs) <= 8:
+            return StringAlgorithms.longest_common_prefix(strs)
+        return StringAlgorithms.longest_common_prefix_minmax(strs)
+    
+    @staticmethod
+    def _common_prefix_length(a, b):
+        """
+        两个字符串公共前缀的长度 - 对长度二分，用startswith比较
+        时间复杂度：O(m*log(m))，比较在C层完成
+        """
+        lo, hi = 0, min(len(a), len(b))
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if b.startswith(a[:mid]):
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+    
     @staticmethod
     def group_anagrams(strs):
         """
@@ -166,4 +819,336 @@ class StringAlgorithms:
             key = ''.join(sorted(s))
             anagram_map[key].append(s)
             
-        return list(anagram_map.values())
\ No newline at end of file
+        return list(anagram_map.values())
+    
+    @staticmethod
+    def anagram_signature(s):
+        """
+        字母异位词的签名，互为异位词的字符串签名相同
+        - 短字符串（k < 64）：排序后的字符串，此时C层排序比26次计数更快
+        - 纯小写ASCII字母：26个字母出现次数组成的元组，由C实现的str.count完成计数
+        - 其他字符串（含Unicode）：字符计数的frozenset
+        互为异位词的字符串长度相同，总会落入同一分支
+        时间复杂度：O(k)
+        """
+        if len(s) < 64:
+            return ''.join(sorted(s))
+        if s.isascii() and s.isalpha() and s.islower():
+            return tuple(map(s.count, _ASCII_LETTERS))
+        
+        from collections import Counter
+        return frozenset(Counter(s).items())
+    
+    @staticmethod
+    def group_anagrams_stream(iterable):
+        """
+        字母异位词分组 - 计数签名，不排序
+        接受任意迭代器，读完输入后逐组产出，不需要先把输入转成列表
+        时间复杂度：O(n*k)
+        空间复杂度：O(n*k)
+        """
+        anagram_map = {}
+        signature = StringAlgorithms.anagram_signature
+        
+        for s in iterable:
+            key = signature(s)
+            group = anagram_map.get(key)
+            if group is None:
+                anagram_map[key] = [s]
+            else:
+                group.append(s)
+        
+        yield from anagram_map.values()
+    
+    @staticmethod
+    def group_anagrams_parallel(strs, processes=None, shards_per_process=4):
+        """
+        字母异位词分组 - 多进程版本，按键哈希分片
+        主进程用(长度, 最小字符, 最大字符)这一异位词不变量的哈希把输入分到若干分片，
+        互为异位词的字符串必然落入同一分片，各进程独占互不相交的键，
+        只把分组结果（不含签名）传回主进程直接拼接，主进程不做按键合并
+        完整签名只在工作进程中计算；分片数为进程数的shards_per_process倍，以平衡负载
+        分组之间的顺序与单进程版本不同
+        """
+        import os
+        from multiprocessing import Pool
+        
+        processes = processes or os.cpu_count() or 1
+        count = processes * shards_per_process
+        shards = [[] for _ in range(count)]
+        for s in strs:
+            # min/max/len都在C层完成，不分配新对象
+            shards[hash((len(s), min(s), max(s))) % count if s else 0].append(s)
+        
+        result = []
+        with Pool(processes) as pool:
+            for groups in pool.imap_unordered(StringAlgorithms._group_anagram_shard, shards):
+                result.extend(groups)
+        return result
+    
+    @staticmethod
+    def _group_anagram_shard(shard):
+        """进程池任务：对一个分片按签名分组，只返回分组"""
+        anagram_map = {}
+        signature = StringAlgorithms.anagram_signature
+        for s in shard:
+            key = signature(s)
+            group = anagram_map.get(key)
+            if group is None:
+                anagram_map[key] = [s]
+            else:
+                group.append(s)
+        return list(anagram_map.values())
+    
+    @staticmethod
+    def _as_sequence(s):
+        """
+        统一输入类型：str/bytes/bytearray原样返回，
+        memoryview、mmap等支持缓冲区协议的对象转为按字节访问的memoryview，不发生复制
+        """
+        if isinstance(s, (str, bytes, bytearray)):
+            return s
+        return memoryview(s).cast('B')
+    
+    @staticmethod
+    def _prefix_function(pattern):
+        """
+        KMP前缀函数：fail[i]为pattern[:i+1]最长相等真前后缀的长度
+        时间复杂度：O(m)
+        """
+        fail = [0] * len(pattern)
+        k = 0
+        for i in range(1, len(pattern)):
+            while k and pattern[i] != pattern[k]:
+                k = fail[k - 1]
+            if pattern[i] == pattern[k]:
+                k += 1
+            fail[i] = k
+        return fail
+    
+    @staticmethod
+    def kmp_search(text, pattern):
+        """
+        KMP算法：惰性返回pattern在text中所有出现位置（含重叠）
+        时间复杂度：O(n + m)
+        空间复杂度：O(m)
+        
+        text和pattern需为同类数据：str对str，bytes/memoryview对bytes/memoryview
+        示例：list(kmp_search("abababa", "aba")) -> [0, 2, 4]
+        """
+        text = StringAlgorithms._as_sequence(text)
+        pattern = StringAlgorithms._as_sequence(pattern)
+        m = len(pattern)
+        if m == 0:
+            raise ValueError("empty pattern")
+        
+        fail = StringAlgorithms._prefix_function(pattern)
+        j = 0 # 已匹配的长度
+        for i, c in enumerate(text):
+            # 失配时沿前缀函数回退，text指针不回退
+            while j and c != pattern[j]:
+                j = fail[j - 1]
+            if c == pattern[j]:
+                j += 1
+            if j == m:
+                yield i - m + 1
+                j = fail[j - 1]
+    
+    @staticmethod
+    def horspool_search(text, pattern):
+        """
+        Boyer-Moore-Horspool算法：按窗口末字符的坏字符表跳跃
+        时间复杂度：平均O(n / m)，最坏O(n * m)
+        空间复杂度：O(σ) σ为字符集大小
+        
+        示例：list(horspool_search("abababa", "aba")) -> [0, 2, 4]
+        """
+        text = StringAlgorithms._as_sequence(text)
+        pattern = StringAlgorithms._as_sequence(pattern)
+        n, m = len(text), len(pattern)
+        if m == 0:
+            raise ValueError("empty pattern")
+        
+        # 坏字符表：字符在pattern[:-1]中最后一次出现到末尾的距离
+        shift = {}
+        for i in range(m - 1):
+            shift[pattern[i]] = m - 1 - i
+        
+        last = pattern[m - 1]
+        i = 0
+        while i <= n - m:
+            c = text[i + m - 1]
+            if c == last:
+                # 从右向左比较剩余字符
+                j = m - 2
+                while j >= 0 and text[i + j] == pattern[j]:
+                    j -= 1
+                if j < 0:
+                    yield i
+            i += shift.get(c, m)
+    
+    @staticmethod
+    def multi_pattern_search(text, patterns):
+        """
+        多模式匹配：惰性返回(起始位置, 模式串)
+        时间复杂度：O(n + Σm + z) z为匹配总数
+        需要对多段文本复用同一组模式时，直接构造AhoCorasick并重复调用search
+        """
+        return AhoCorasick(patterns).search(text)
+
+# Aho-Corasick自动机
+class AhoCorasick:
+    """
+    Aho-Corasick多模式匹配自动机
+    在Trie上构建失配指针，一次扫描文本即可找出所有模式串的出现位置
+    时间复杂度：
+    - 构建 O(Σm) Σm为模式串总长
+    - 查询 O(n + z) z为匹配总数
+    """
+    def __init__(self, patterns):
+        self.patterns = list(patterns) # 原始模式串
+        self.goto = [{}]   # 状态转移表，0为根节点
+        self.fail = [0]    # 失配指针
+        self.output = [[]] # 每个状态可以输出的模式串下标
+        self.lengths = []  # 模式串长度
+        
+        for idx, pattern in enumerate(self.patterns):
+            self._add(idx, StringAlgorithms._as_sequence(pattern))
+        self._build()
+    
+    def _add(self, idx, pattern):
+        """将模式串插入Trie"""
+        if len(pattern) == 0:
+            raise ValueError("empty pattern")
+        
+        state = 0
+        for c in pattern:
+            nxt = self.goto[state].get(c)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][c] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            state = nxt
+        self.output[state].append(idx)
+        self.lengths.append(len(pattern))
+    
+    def _build(self):
+        """BFS构建失配指针，并把失配链上的输出合并到当前状态"""
+        from collections import deque
+        
+        queue = deque(self.goto[0].values()) # 第一层的失配指针指向根
+        while queue:
+            u = queue.popleft()
+            for c, v in self.goto[u].items():
+                f = self.fail[u]
+                while f and c not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[v] = self.goto[f].get(c, 0)
+                self.output[v] = self.output[v] + self.output[self.fail[v]]
+                queue.append(v)
+    
+    def search(self, text):
+        """
+        扫描文本，惰性返回(起始位置, 模式串)
+        时间复杂度：O(n + z)
+        """
+        text = StringAlgorithms._as_sequence(text)
+        goto, fail, output, lengths = self.goto, self.fail, self.output, self.lengths
+        
+        state = 0
+        for i, c in enumerate(text):
+            while state and c not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(c, 0)
+            for idx in output[state]:
+                yield i - lengths[idx] + 1, self.patterns[idx]
+
+# 压缩字典树
+class RadixTrie:
+    """
+    压缩字典树（基数树）：单分支的路径合并为一条边
+    支持增量插入，并可查询任意前缀下所有键的最长公共前缀
+    时间复杂度：
+    - 插入 O(m)
+    - 查询最长公共前缀 O(m + 结果长度)
+    """
+    class Node:
+        def __init__(self, label="", is_end=False):
+            self.label = label    # 从父节点到当前节点的边上的字符串
+            self.is_end = is_end  # 是否为某个键的结尾
+            self.children = {}    # 首字符 -> 子节点
+    
+    def __init__(self, words=()):
+        self.root = self.Node()
+        self.size = 0
+        for word in words:
+            self.insert(word)
+    
+    def __len__(self):
+        """返回键的个数"""
+        return self.size
+    
+    def insert(self, word):
+        """
+        插入一个键
+        时间复杂度：O(m)
+        """
+        node = self.root
+        i = 0
+        while i < len(word):
+            child = node.children.get(word[i])
+            if child is None:
+                # 没有可共享的边，剩余部分直接作为新边
+                node.children[word[i]] = self.Node(word[i:], True)
+                self.size += 1
+                return
+            
+            label = child.label
+            k = StringAlgorithms._common_prefix_length(label, word[i:i + len(label)])
+            if k < len(label):
+                # 在公共部分末尾分裂边
+                mid = self.Node(label[:k])
+                child.label = label[k:]
+                mid.children[child.label[0]] = child
+                node.children[word[i]] = mid
+                child = mid
+            
+            node = child
+            i += k
+        
+        if not node.is_end:
+            node.is_end = True
+            self.size += 1
+    
+    def longest_common_prefix(self, prefix=""):
+        """
+        以prefix开头的所有键的最长公共前缀，prefix为空时即全部键的最长公共前缀
+        不存在以prefix开头的键时返回None
+        时间复杂度：O(m + 结果长度)
+        """
+        node = self.root
+        parts = []
+        i = 0
+        while i < len(prefix):
+            child = node.children.get(prefix[i])
+            if child is None:
+                return None
+            
+            label = child.label
+            k = StringAlgorithms._common_prefix_length(label, prefix[i:i + len(label)])
+            if k < len(label) and i + k < len(prefix):
+                return None
+            
+            # prefix可能在边的中间结束，该边下所有键都共享整条边
+            parts.append(label)
+            node = child
+            i += len(label)
+        
+        # 沿唯一分支继续向下，直到出现分叉或某个键在此结束
+        while not node.is_end and len(node.children) == 1:
+            node = next(iter(node.children.values()))
+            parts.append(node.label)
+        
+        return "".join(parts)
\ No newline at end of file
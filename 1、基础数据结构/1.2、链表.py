@@ -1,47 +1,118 @@
+import functools
+import sys
+import time
+from array import array
+
 # 单链表实现
 class ListNode:
-    """链表节点"""
+    """链表节点，使用__slots__去掉实例字典，每个节点约48字节（原先约88字节）"""
+    __slots__ = ('val', 'next')
+    
     def __init__(self, val=0, next=None):
         self.val = val
         self.next = next
         
+# 节点池
+class NodePool:
+    """
+    节点池：回收被删除的节点，下次创建节点时优先复用，减少内存分配
+    注意：节点被回收后会被清空并复用，调用方不应再持有已删除节点的引用
+    """
+    def __init__(self, node_class=ListNode, max_size=1 << 16):
+        self.node_class = node_class
+        self.max_size = max_size # 空闲节点数上限
+        self.free = []           # 空闲节点
+        self.allocated = 0       # 新分配的节点数
+        self.reused = 0          # 复用的节点数
+    
+    def acquire(self, *args):
+        """取出一个节点并用args初始化"""
+        if self.free:
+            node = self.free.pop()
+            node.__init__(*args)
+            self.reused += 1
+            return node
+        
+        self.allocated += 1
+        return self.node_class(*args)
+    
+    def release(self, node):
+        """回收节点，清空其引用防止内存泄漏"""
+        if len(self.free) < self.max_size:
+            node.__init__()
+            self.free.append(node)
+
 class LinkedList:
     """
     单链表实现
     支持头部/尾部插入删除、反转、环检测等操作
+    维护尾指针，尾部插入O(1)，可作为FIFO使用
+    传入pool时从节点池分配节点，删除的节点归还节点池
     """
-    def __init__(self):
+    def __init__(self, pool=None):
+        if pool is not None and not issubclass(pool.node_class, ListNode):
+            raise TypeError("LinkedList needs a NodePool(ListNode)")
         self.head = None
+        self.tail = None # 尾指针
         self.size = 0
+        self.pool = pool # 节点池，None表示不复用节点
+        
+    def _new_node(self, val):
+        """创建节点，有节点池时优先复用"""
+        if self.pool is None:
+            return ListNode(val)
+        return self.pool.acquire(val)
         
     def add_first(self, val):
         """
         在链表头部添加节点
         时间复杂度：O(1)
         """
-        new_node = ListNode(val)
+        new_node = self._new_node(val)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
         self.size += 1
         
     def add_last(self, val):
         """
         在链表尾部添加节点
-        时间复杂度：O(n)
+        时间复杂度：O(1)
         """
-        new_node = ListNode(val)
+        new_node = self._new_node(val)
         if not self.head:
             self.head = new_node
         else:
-            # 遍历到最后一个节点
-            current = self.head
-            while current.next:
-                current = current.next
-                
-            current.next = new_node
+            # 直接挂在尾指针之后
+            self.tail.next = new_node
             
+        self.tail = new_node
         self.size += 1
         
+    def extend(self, iterable):
+        """
+        在链表尾部批量添加节点，一次遍历完成链接
+        时间复杂度：O(k)
+        """
+        dummy = ListNode(0) # 哨兵节点
+        last = dummy
+        count = 0
+        for val in iterable:
+            last.next = self._new_node(val)
+            last = last.next
+            count += 1
+        
+        if count == 0:
+            return
+        
+        if self.head:
+            self.tail.next = dummy.next
+        else:
+            self.head = dummy.next
+        self.tail = last
+        self.size += count
+        
     def add_at_index(self, index, val):
         """
         在指定位置插入节点
@@ -54,12 +125,16 @@ class LinkedList:
             self.add_first(val)
             return
         
+        if index == self.size:
+            self.add_last(val)
+            return
+        
         # 找到插入位置前的前面一个节点
         prev = self.head
         for _ in range(index - 1):
             prev = prev.next
         
-        new_node = ListNode(val)
+        new_node = self._new_node(val)
         new_node.next = prev.next
         prev.next = new_node
         self.size += 1
@@ -72,15 +147,20 @@ class LinkedList:
         if not self.head:
             raise IndexError("Remove from empty list")
         
-        val = self.head.val
-        self.head = self.head.next
+        node = self.head
+        val = node.val
+        self.head = node.next
+        if self.head is None:
+            self.tail = None
         self.size -= 1
+        if self.pool is not None:
+            self.pool.release(node)
         return val
         
     def remove_last(self):
         """
         删除尾节点
-        时间复杂度：O(1)
+        时间复杂度：O(n) 单链表需要找到倒数第二个节点
         """
         if not self.head:
             raise IndexError("remove from empty list")
@@ -93,9 +173,13 @@ class LinkedList:
         while current.next.next:
             current = current.next
             
-        val = current.next.val
+        node = current.next
+        val = node.val
         current.next = None
+        self.tail = current
         self.size -= 1
+        if self.pool is not None:
+            self.pool.release(node)
         return val
     
     def reverse(self):
@@ -106,6 +190,7 @@ class LinkedList:
         """
         prev = None
         current = self.head
+        self.tail = self.head # 原头节点成为尾节点
         
         while current:
             # 保存下一个节点
@@ -118,11 +203,13 @@ class LinkedList:
         
         self.head = prev    
     
-    def reverse_recurisve(self):
+    def reverse_recurisve(self, chunk_size=500):
         """
         反转链表 - 递归法
+        先切成最多chunk_size个节点的块，块内递归反转，再把各块逆序拼接
+        递归深度不超过chunk_size，超长链表也不会超过递归上限
         时间复杂度：O(n)
-        空间复杂度：O(n) 递归调用栈
+        空间复杂度：O(chunk_size) 递归调用栈
         """
         def reverse_helper(node):
             # 基础情况：空链表或只有一个节点
@@ -138,7 +225,80 @@ class LinkedList:
             
             return new_head
         
-        self.head = reverse_helper(self.head)
+        self.tail = self.head
+        result = None
+        node = self.head
+        while node:
+            # 切下一块
+            end = node
+            for _ in range(chunk_size - 1):
+                if not end.next:
+                    break
+                end = end.next
+            rest = end.next
+            end.next = None
+            
+            # 块内递归反转后，原块头成为块尾，接到已反转部分之前
+            chunk_head = reverse_helper(node)
+            node.next = result
+            result = chunk_head
+            node = rest
+        
+        self.head = result
+    
+    def reverse_k_group(self, k):
+        """
+        每k个节点一组进行反转，最后不足k个的节点保持原顺序
+        时间复杂度：O(n)
+        空间复杂度：O(1)
+        """
+        if k < 1:
+            raise ValueError("k must be positive")
+        
+        dummy = ListNode(0, self.head) # 哨兵节点
+        group_prev = dummy
+        while True:
+            # 检查剩余节点是否够k个
+            kth = group_prev
+            for _ in range(k):
+                kth = kth.next
+                if not kth:
+                    break
+            if not kth:
+                break
+            
+            # 反转[group_prev.next, kth]
+            group_next = kth.next
+            first = group_prev.next
+            prev, current = group_next, first
+            while current is not group_next:
+                current.next, prev, current = prev, current, current.next
+            
+            group_prev.next = kth
+            group_prev = first
+        
+        self.head = dummy.next
+        # 最后一组被反转时，尾指针变为该组原来的第一个节点
+        if group_prev is not dummy and not group_prev.next:
+            self.tail = group_prev
+    
+    def __len__(self):
+        """返回链表长度"""
+        return self.size
+    
+    def __iter__(self):
+        """从头到尾遍历节点值"""
+        current = self.head
+        while current:
+            yield current.val
+            current = current.next
+    
+    def __reversed__(self):
+        """
+        从尾到头遍历节点值
+        单链表无法反向移动，先顺序收集再逆序产出，空间复杂度：O(n)
+        """
+        return reversed(list(self))
         
     def find_middle(self):
         """
@@ -227,17 +387,795 @@ class LinkedList:
             else:
                 tail.next = p2
                 p2 = p2.next
+            tail = tail.next
         
-        # 连接剩余节点
+        # 连接剩余节点，尾指针取剩余部分所在链表的尾
         tail.next = p1 if p1 else p2
+        if p1:
+            tail = self.tail
+        elif p2:
+            tail = other.tail
         
         self.head = dummy.next
+        self.tail = tail if self.head else None
         
         self.size += other.size
+    
+    @staticmethod
+    def merge_k_sorted(lists):
+        """
+        多路归并：用最小堆合并k个有序链表，直接重新链接原有节点
+        合并后原链表被清空，值相等时按链表在lists中的顺序排列（稳定）
+        时间复杂度：O(N*log(k)) N为节点总数
+        空间复杂度：O(k)
+        """
+        import heapq
+        
+        result = LinkedList()
+        # 堆元素为(值, 链表序号, 节点)，序号保证稳定并避免比较节点
+        heap = [(lst.head.val, i, lst.head) for i, lst in enumerate(lists) if lst.head]
+        heapq.heapify(heap)
+        
+        dummy = ListNode(0) # 哨兵节点
+        tail = dummy
+        while heap:
+            _, i, node = heap[0]
+            tail.next = node
+            tail = node
+            if node.next:
+                heapq.heapreplace(heap, (node.next.val, i, node.next))
+            else:
+                heapq.heappop(heap)
+        
+        result.head = dummy.next
+        result.tail = tail if result.head else None
+        for lst in lists:
+            result.size += lst.size
+            lst.head = lst.tail = None
+            lst.size = 0
+        return result
+    
+    @staticmethod
+    def iter_merge_sorted(lists):
+        """
+        多路归并的惰性版本：按顺序逐个产出合并后的值，不修改原链表
+        时间复杂度：O(N*log(k))
+        空间复杂度：O(k)
+        """
+        import heapq
+        
+        return heapq.merge(*lists)
+    
+    def sort(self):
+        """
+        原地归并排序 - 自底向上，子链表长度按1、2、4...倍增，稳定
+        时间复杂度：O(n*log(n))
+        空间复杂度：O(1)
+        """
+        dummy = ListNode(0, self.head) # 哨兵节点
+        step = 1
+        while step < self.size:
+            prev = dummy
+            current = dummy.next
+            while current:
+                # 切出两段长度为step的子链表并合并，接到prev之后
+                left = current
+                right = self._split(left, step)
+                current = self._split(right, step)
+                prev = self._merge_two(left, right, prev)
+            step *= 2
+        
+        self.head = dummy.next
+        tail = dummy
+        while tail.next:
+            tail = tail.next
+        self.tail = tail if self.head else None
+    
+    @staticmethod
+    def _split(head, n):
+        """从head开始保留n个节点并断开，返回剩余部分的头节点"""
+        for _ in range(n - 1):
+            if not head:
+                break
+            head = head.next
+        if not head:
+            return None
+        rest = head.next
+        head.next = None
+        return rest
+    
+    @staticmethod
+    def _merge_two(left, right, prev):
+        """合并两个有序子链表并接在prev之后，返回合并结果的尾节点"""
+        while left and right:
+            if left.val <= right.val:
+                prev.next = left
+                left = left.next
+            else:
+                prev.next = right
+                right = right.next
+            prev = prev.next
+        
+        prev.next = left if left else right
+        while prev.next:
+            prev = prev.next
+        return prev
+                
+# 数组实现的单链表
+class IndexLinkedList:
+    """
+    基于并行数组的单链表，增删、反转、找中点、环检测、合并等基本接口与LinkedList一致；
+    k路合并、归并排序、按组反转等扩展操作只在LinkedList中提供
+    节点用下标表示：vals[i]为节点值，nexts[i]为后继下标，-1表示空
+    删除的槽位通过nexts串成空闲链表复用，不产生节点对象，
+    每个节点约16字节（8字节值指针 + 8字节后继下标），LinkedList每个节点约48字节
+    find_middle和find_cycle_start返回节点下标
+    """
+    def __init__(self):
+        self.vals = []             # 节点值
+        self.nexts = array('q')    # 后继下标
+        self.head = -1
+        self.tail = -1
+        self.size = 0
+        self.free = -1             # 空闲槽位链表头
+    
+    def __len__(self):
+        """返回链表长度"""
+        return self.size
+    
+    def __iter__(self):
+        """从头到尾遍历节点值"""
+        vals, nexts = self.vals, self.nexts
+        i = self.head
+        while i != -1:
+            yield vals[i]
+            i = nexts[i]
+    
+    def _new_node(self, val, nxt=-1):
+        """分配一个槽位，优先复用空闲槽位"""
+        if self.free != -1:
+            i = self.free
+            self.free = self.nexts[i]
+            self.vals[i] = val
+            self.nexts[i] = nxt
+            return i
+        
+        self.vals.append(val)
+        self.nexts.append(nxt)
+        return len(self.vals) - 1
+    
+    def _release(self, i):
+        """归还槽位到空闲链表"""
+        self.vals[i] = None # 防止内存泄漏
+        self.nexts[i] = self.free
+        self.free = i
+    
+    def add_first(self, val):
+        """
+        在链表头部添加节点
+        时间复杂度：O(1)
+        """
+        self.head = self._new_node(val, self.head)
+        if self.tail == -1:
+            self.tail = self.head
+        self.size += 1
+    
+    def add_last(self, val):
+        """
+        在链表尾部添加节点
+        时间复杂度：O(1)
+        """
+        i = self._new_node(val)
+        if self.head == -1:
+            self.head = i
+        else:
+            self.nexts[self.tail] = i
+        self.tail = i
+        self.size += 1
+    
+    def extend(self, iterable):
+        """
+        在链表尾部批量添加节点
+        时间复杂度：O(k)
+        """
+        for val in iterable:
+            self.add_last(val)
+    
+    def add_at_index(self, index, val):
+        """
+        在指定位置插入节点
+        时间复杂度：O(n)
+        """
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of range")
+        
+        if index == 0:
+            self.add_first(val)
+            return
+        
+        if index == self.size:
+            self.add_last(val)
+            return
+        
+        prev = self.head
+        for _ in range(index - 1):
+            prev = self.nexts[prev]
+        
+        self.nexts[prev] = self._new_node(val, self.nexts[prev])
+        self.size += 1
+    
+    def remove_first(self):
+        """
+        删除头节点
+        时间复杂度：O(1)
+        """
+        if self.head == -1:
+            raise IndexError("Remove from empty list")
+        
+        i = self.head
+        val = self.vals[i]
+        self.head = self.nexts[i]
+        if self.head == -1:
+            self.tail = -1
+        self._release(i)
+        self.size -= 1
+        return val
+    
+    def remove_last(self):
+        """
+        删除尾节点
+        时间复杂度：O(n)
+        """
+        if self.head == -1:
+            raise IndexError("remove from empty list")
+        
+        if self.nexts[self.head] == -1:
+            return self.remove_first()
+        
+        # 找到倒数第二个节点
+        current = self.head
+        while self.nexts[self.nexts[current]] != -1:
+            current = self.nexts[current]
+        
+        i = self.nexts[current]
+        val = self.vals[i]
+        self.nexts[current] = -1
+        self.tail = current
+        self._release(i)
+        self.size -= 1
+        return val
+    
+    def reverse(self):
+        """
+        反转链表 - 迭代法
+        时间复杂度：O(n)
+        空间复杂度：O(1)
+        """
+        nexts = self.nexts
+        prev, current = -1, self.head
+        self.tail = self.head
+        while current != -1:
+            nexts[current], prev, current = prev, current, nexts[current]
+        self.head = prev
+    
+    def reverse_recurisve(self, chunk_size=500):
+        """
+        反转链表，与LinkedList.reverse_recurisve接口一致
+        下标链表没有节点对象可以递归，直接使用迭代法，结果与reverse相同
+        时间复杂度：O(n)
+        空间复杂度：O(1)
+        """
+        self.reverse()
+    
+    def find_middle(self):
+        """
+        找到链表中点的下标 - 快慢指针法
+        时间复杂度：O(n)
+        """
+        if self.head == -1:
+            return None
+        
+        nexts = self.nexts
+        slow = fast = self.head
+        while fast != -1 and nexts[fast] != -1:
+            slow = nexts[slow]
+            fast = nexts[nexts[fast]]
+        return slow
+    
+    def has_cycle(self):
+        """
+        检测链表是否有环 - Floyd判圈算法
+        时间复杂度：O(n)
+        """
+        return self.find_cycle_start() is not None
+    
+    def find_cycle_start(self):
+        """
+        找到环起始节点的下标，无环时返回None
+        时间复杂度：O(n)
+        """
+        nexts = self.nexts
+        slow = fast = self.head
+        while fast != -1 and nexts[fast] != -1:
+            slow = nexts[slow]
+            fast = nexts[nexts[fast]]
+            if slow == fast:
+                break
+        else:
+            return None
+        
+        slow = self.head
+        while slow != fast:
+            slow = nexts[slow]
+            fast = nexts[fast]
+        return slow
+    
+    def merge_sorted(self, other):
+        """
+        合并两个有序链表，other的节点会被复制到当前链表的数组中
+        时间复杂度：O(m + n)
+        """
+        vals, nexts = self.vals, self.nexts
+        merged = IndexLinkedList()
+        p1, p2 = self.head, other.head
+        while p1 != -1 and p2 != -1:
+            if vals[p1] <= other.vals[p2]:
+                merged.add_last(vals[p1])
+                p1 = nexts[p1]
+            else:
+                merged.add_last(other.vals[p2])
+                p2 = other.nexts[p2]
+        
+        while p1 != -1:
+            merged.add_last(vals[p1])
+            p1 = nexts[p1]
+        while p2 != -1:
+            merged.add_last(other.vals[p2])
+            p2 = other.nexts[p2]
+        
+        # 合并结果紧凑地存放在新数组中，顺带丢弃空闲槽位
+        self.vals, self.nexts = merged.vals, merged.nexts
+        self.head, self.tail, self.free = merged.head, merged.tail, merged.free
+        self.size = merged.size
+    
+    def __str__(self):
+        """字符串表示"""
+        values = []
+        current = self.head
+        while current != -1:
+            values.append(str(self.vals[current]))
+            current = self.nexts[current]
+        return '->'.join(values)
+                
+# 支持按位置访问的单链表
+class IndexedLinkedList:
+    """
+    分块索引单链表：在普通单链表之上，每隔一段记录一个检查点[块首节点, 块内节点数]
+    各块节点数另存一棵树状数组，按位置访问时在树上二分出所在的块，再在块内顺序查找
+    块内节点数保持在(0, 2*block_size]；block_size为初始块大小，也是下限，
+    元素个数超过4*block_size²时块大小翻倍、低于block_size²/4时减半，使其始终在√n左右
+    时间复杂度：
+    - 头部/尾部插入 O(1) 摊还
+    - 按位置访问/插入/删除 O(log n + √n)
+    """
+    def __init__(self, block_size=64):
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.block_size = block_size
+        self.min_block_size = block_size # 块大小下限
+        self.blocks = [] # 检查点：[块首节点, 块内节点数]
+        self._tree = None # 各块节点数的树状数组（下标从1开始），块增删后置为None，下次定位时重建
+        self._top = 0     # 不超过块数的最大2的幂，树上二分的起始步长
+    
+    def __len__(self):
+        """返回链表长度"""
+        return self.size
+    
+    def __iter__(self):
+        """从头到尾遍历节点值"""
+        current = self.head
+        while current:
+            yield current.val
+            current = current.next
+    
+    def _build_tree(self):
+        """
+        按各块节点数重建树状数组
+        时间复杂度：O(n/block_size)
+        """
+        tree = [0] + [count for _, count in self.blocks]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._top = 1 << (len(tree) - 1).bit_length() >> 1
+    
+    def _add_count(self, b, delta):
+        """第b块节点数变化delta，同步更新树状数组"""
+        self.blocks[b][1] += delta
+        tree = self._tree
+        if tree is not None:
+            i = b + 1
+            while i < len(tree):
+                tree[i] += delta
+                i += i & -i
+    
+    def _locate(self, index):
+        """
+        返回下标所在的块序号和块内偏移，调用方需保证下标合法
+        在树状数组上二分：找到前缀节点数不超过index的最多块数
+        时间复杂度：O(log n)
+        """
+        if self._tree is None:
+            self._build_tree()
+        tree = self._tree
+        b, step = 0, self._top
+        while step:
+            nxt = b + step
+            if nxt < len(tree) and tree[nxt] <= index:
+                b = nxt
+                index -= tree[nxt]
+            step >>= 1
+        return b, index
+    
+    def _rebalance(self):
+        """元素个数跨过阈值时调整块大小并重新分块，摊还O(1)"""
+        bs = self.block_size
+        if self.size > 4 * bs * bs:
+            self._reblock(2 * bs)
+        elif bs > self.min_block_size and self.size < bs * bs // 4:
+            self._reblock(bs // 2)
+    
+    def _reblock(self, block_size):
+        """
+        按新的块大小从头重新划分检查点
+        时间复杂度：O(n)
+        """
+        self.block_size = block_size
+        blocks = []
+        node, remaining = self.head, self.size
+        while remaining > 0:
+            count = min(block_size, remaining)
+            blocks.append([node, count])
+            node = self._walk(node, count)
+            remaining -= count
+        self.blocks = blocks
+        self._tree = None
+    
+    def _walk(self, node, steps):
+        """从node向后走steps步"""
+        for _ in range(steps):
+            node = node.next
+        return node
+    
+    def get(self, index):
+        """
+        获取指定位置的值
+        时间复杂度：O(log n + √n)
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range")
+        
+        b, offset = self._locate(index)
+        return self._walk(self.blocks[b][0], offset).val
+    
+    __getitem__ = get
+    
+    def add_first(self, val):
+        """
+        在链表头部添加节点
+        时间复杂度：O(1) 摊还
+        """
+        node = ListNode(val, self.head)
+        self.head = node
+        if self.tail is None:
+            self.tail = node
+        
+        # 首块不足block_size时直接并入首块，否则在最前面新开一块
+        # 两端新开的块都留出block_size的余量，之后在块内插入不会马上分裂
+        if self.blocks and self.blocks[0][1] < self.block_size:
+            self.blocks[0][0] = node
+            self._add_count(0, 1)
+        else:
+            self.blocks.insert(0, [node, 1])
+            self._tree = None
+        self.size += 1
+        self._rebalance()
+    
+    def add_last(self, val):
+        """
+        在链表尾部添加节点
+        时间复杂度：O(1)
+        """
+        node = ListNode(val)
+        if self.tail is None:
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        
+        if self.blocks and self.blocks[-1][1] < self.block_size:
+            self._add_count(len(self.blocks) - 1, 1)
+        else:
+            self.blocks.append([node, 1])
+            self._tree = None
+        self.size += 1
+        self._rebalance()
+    
+    def add_at_index(self, index, val):
+        """
+        在指定位置插入节点
+        时间复杂度：O(log n + √n)
+        """
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of range")
+        
+        if index == 0:
+            self.add_first(val)
+            return
+        
+        if index == self.size:
+            self.add_last(val)
+            return
+        
+        # 新节点插在index-1号节点之后，归入该节点所在的块
+        b, offset = self._locate(index - 1)
+        prev = self._walk(self.blocks[b][0], offset)
+        prev.next = ListNode(val, prev.next)
+        self._add_count(b, 1)
+        self.size += 1
+        
+        # 块过大时从中间分裂
+        block = self.blocks[b]
+        if block[1] > 2 * self.block_size:
+            mid = self._walk(block[0], self.block_size)
+            self.blocks.insert(b + 1, [mid, block[1] - self.block_size])
+            block[1] = self.block_size
+            self._tree = None
+        self._rebalance()
+    
+    def remove_first(self):
+        """
+        删除头节点
+        时间复杂度：O(1) 摊还
+        """
+        return self.remove_at_index(0)
+    
+    def remove_last(self):
+        """
+        删除尾节点
+        时间复杂度：O(log n + √n)
+        """
+        return self.remove_at_index(self.size - 1)
+    
+    def remove_at_index(self, index):
+        """
+        删除指定位置的节点
+        时间复杂度：O(log n + √n)
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Remove from empty list" if self.size == 0 else "Index out of range")
+        
+        b, offset = self._locate(index)
+        block = self.blocks[b]
+        if index == 0:
+            node = self.head
+            self.head = node.next
+            prev = None
+        elif offset > 0:
+            prev = self._walk(block[0], offset - 1)
+            node = prev.next
+        else:
+            # 被删节点是块首，前驱是上一块的最后一个节点
+            prev_block = self.blocks[b - 1]
+            prev = self._walk(prev_block[0], prev_block[1] - 1)
+            node = prev.next
+        
+        if prev is not None:
+            prev.next = node.next
+        if node is self.tail:
+            self.tail = prev
+        
+        self._add_count(b, -1)
+        if offset == 0:
+            block[0] = node.next
+        self.size -= 1
+        
+        if block[1] == 0:
+            del self.blocks[b]
+            self._tree = None
+        elif block[1] < self.block_size // 2 and b + 1 < len(self.blocks) \
+                and block[1] + self.blocks[b + 1][1] <= 2 * self.block_size:
+            # 块过小时与后一块合并，避免检查点过多
+            block[1] += self.blocks[b + 1][1]
+            del self.blocks[b + 1]
+            self._tree = None
+        self._rebalance()
+        
+        return node.val
+                
+# 展开链表
+class UnrolledNode:
+    """展开链表节点，每个节点保存一小段值"""
+    __slots__ = ('items', 'next')
+    
+    def __init__(self, items=None, next=None):
+        self.items = items if items is not None else []
+        self.next = next
+
+class UnrolledLinkedList:
+    """
+    展开链表：每个节点保存最多node_capacity个值，接口与LinkedList一致
+    遍历时每个节点内部是连续的list，指针跳转次数降为约n/node_capacity
+    节点超过容量时对半分裂，不足一半时与后继节点合并
+    时间复杂度：
+    - 头部/尾部插入 O(node_capacity)，容量较小时视为O(1)
+    - 按位置访问/插入/删除 O(n/node_capacity + node_capacity)
+    """
+    def __init__(self, node_capacity=64):
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.node_capacity = node_capacity
+    
+    def __len__(self):
+        """返回元素个数"""
+        return self.size
+    
+    def __iter__(self):
+        """从头到尾遍历所有值"""
+        node = self.head
+        while node:
+            yield from node.items
+            node = node.next
+    
+    def iter_chunks(self):
+        """按节点批量遍历，每次产出一个节点内值的副本"""
+        node = self.head
+        while node:
+            yield node.items[:]
+            node = node.next
+    
+    def _locate(self, index):
+        """返回(前驱节点, 所在节点, 节点内偏移)"""
+        prev, node = None, self.head
+        while index >= len(node.items):
+            index -= len(node.items)
+            prev, node = node, node.next
+        return prev, node, index
+    
+    def get(self, index):
+        """
+        获取指定位置的值
+        时间复杂度：O(n/node_capacity)
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range")
+        _, node, offset = self._locate(index)
+        return node.items[offset]
+    
+    def add_first(self, val):
+        """在头部添加元素"""
+        if self.head and len(self.head.items) < self.node_capacity:
+            self.head.items.insert(0, val)
+        else:
+            self.head = UnrolledNode([val], self.head)
+            if self.tail is None:
+                self.tail = self.head
+        self.size += 1
+    
+    def add_last(self, val):
+        """在尾部添加元素"""
+        if self.tail and len(self.tail.items) < self.node_capacity:
+            self.tail.items.append(val)
+        else:
+            node = UnrolledNode([val])
+            if self.tail is None:
+                self.head = node
+            else:
+                self.tail.next = node
+            self.tail = node
+        self.size += 1
+    
+    def extend(self, iterable):
+        """在尾部批量添加元素，按节点容量整段填充"""
+        values = list(iterable)
+        cap = self.node_capacity
+        i = 0
+        # 先填满当前尾节点
+        if self.tail and values:
+            i = cap - len(self.tail.items)
+            self.tail.items.extend(values[:i])
+        
+        for start in range(max(i, 0), len(values), cap):
+            node = UnrolledNode(values[start:start + cap])
+            if self.tail is None:
+                self.head = node
+            else:
+                self.tail.next = node
+            self.tail = node
+        self.size += len(values)
+    
+    def add_at_index(self, index, val):
+        """
+        在指定位置插入元素
+        时间复杂度：O(n/node_capacity + node_capacity)
+        """
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of range")
+        
+        if index == self.size:
+            self.add_last(val)
+            return
+        
+        _, node, offset = self._locate(index)
+        node.items.insert(offset, val)
+        self.size += 1
+        
+        # 节点溢出时对半分裂
+        if len(node.items) > self.node_capacity:
+            half = len(node.items) // 2
+            node.next = UnrolledNode(node.items[half:], node.next)
+            del node.items[half:]
+            if node is self.tail:
+                self.tail = node.next
+    
+    def remove_first(self):
+        """删除头部元素"""
+        if self.size == 0:
+            raise IndexError("Remove from empty list")
+        return self.remove_at_index(0)
+    
+    def remove_last(self):
+        """删除尾部元素"""
+        if self.size == 0:
+            raise IndexError("remove from empty list")
+        return self.remove_at_index(self.size - 1)
+    
+    def remove_at_index(self, index):
+        """
+        删除指定位置的元素
+        时间复杂度：O(n/node_capacity + node_capacity)
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range")
+        
+        prev, node, offset = self._locate(index)
+        val = node.items.pop(offset)
+        self.size -= 1
+        
+        if not node.items:
+            # 节点变空时摘除
+            if prev is None:
+                self.head = node.next
+            else:
+                prev.next = node.next
+            if node is self.tail:
+                self.tail = prev
+        elif len(node.items) < self.node_capacity // 2 and node.next \
+                and len(node.items) + len(node.next.items) <= self.node_capacity:
+            # 节点过空时与后继合并
+            absorbed = node.next
+            node.items.extend(absorbed.items)
+            node.next = absorbed.next
+            if absorbed is self.tail:
+                self.tail = node
+        
+        return val
+    
+    def find_middle(self):
+        """返回中间位置的值（偶数个时为靠后的一个），与LinkedList.find_middle位置一致"""
+        if self.size == 0:
+            return None
+        return self.get(self.size // 2)
                 
 # 双向链表的实现
 class DoublyListNode:
-    """双向链表节点"""
+    """双向链表节点，使用__slots__去掉实例字典"""
+    __slots__ = ('val', 'prev', 'next')
+    
     def __init__(self, val=0, prev=None, next=None):
         self.val = val
         self.prev = prev
@@ -247,26 +1185,45 @@ class DoublyLinkList:
     """
     双向链表实现
     相比单链表,可以O(1)时间删除给定节点
+    传入pool时从节点池分配节点，删除的节点归还节点池
     """        
-    def __init__(self):
+    def __init__(self, pool=None):
+        if pool is not None and not issubclass(pool.node_class, DoublyListNode):
+            raise TypeError("DoublyLinkList needs a NodePool(DoublyListNode)")
         # 使用哨兵节点简化边界处理
-        self.head = DoublyListNode # 头哨兵
-        self.tail = DoublyListNode # 尾哨兵
+        self.head = DoublyListNode() # 头哨兵
+        self.tail = DoublyListNode() # 尾哨兵
         self.head.next = self.tail
         self.tail.prev = self.head
         self.size = 0    
+        self.pool = pool # 节点池，None表示不复用节点
      
     def add_frist(self, val):
-        """在头部添加节点"""
-        self._add_between(val, self.head, self.head.next)
+        """在头部添加节点，返回新节点"""
+        return self._add_between(val, self.head, self.head.next)
     
     def add_last(self, val):
-        """在尾部添加节点"""
-        self._add_between(val, self.tail.prev, self.tail)
+        """在尾部添加节点，返回新节点"""
+        return self._add_between(val, self.tail.prev, self.tail)
+    
+    def move_to_first(self, node):
+        """
+        将已有节点移动到头部，不重新分配节点
+        时间复杂度O(1)
+        """
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = self.head
+        node.next = self.head.next
+        self.head.next.prev = node
+        self.head.next = node
     
     def _add_between(self, val, pred, succ):
         """在pred和succ之间插入新节点"""
-        new_node = DoublyListNode(val, pred, succ)
+        if self.pool is None:
+            new_node = DoublyListNode(val, pred, succ)
+        else:
+            new_node = self.pool.acquire(val, pred, succ)
         pred.next = new_node
         succ.prev = new_node
         self.size += 1
@@ -285,7 +1242,10 @@ class DoublyLinkList:
         pred.next = succ
         succ.prev = pred
         self.size -= 1
-        return node.val
+        val = node.val
+        if self.pool is not None:
+            self.pool.release(node)
+        return val
     
     def remove_first(self):
         """删除第一个节点"""
@@ -308,4 +1268,222 @@ class DoublyLinkList:
         while current != self.tail:
             values.append(str(current.val))
             current = current.next
-        return '<->'.join(values)
\ No newline at end of file
+        return '<->'.join(values)
+
+# 基于双向链表的缓存
+class LRUCache:
+    """
+    LRU缓存：哈希表 + 双向链表
+    链表头部为最近使用的键，淘汰时从尾部删除
+    - capacity：最大条目数
+    - max_bytes：按sizeof估算的总字节数上限，None表示不限制
+    - ttl：条目存活秒数，None表示不过期；过期条目在访问时惰性删除
+    时间复杂度：get/put O(1)
+    """
+    def __init__(self, capacity=128, max_bytes=None, ttl=None, sizeof=sys.getsizeof, clock=time.monotonic):
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.clock = clock
+        self.order = DoublyLinkList() # 节点值为键
+        self.entries = {}             # 键 -> [节点, 值, 字节数, 过期时间]
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def __len__(self):
+        """返回缓存条目数（可能含尚未清理的过期条目）"""
+        return len(self.entries)
+    
+    def __contains__(self, key):
+        """判断键是否在缓存中且未过期，不影响访问顺序"""
+        entry = self.entries.get(key)
+        return entry is not None and not self._expired(entry)
+    
+    def _expired(self, entry):
+        """判断条目是否已过期"""
+        return entry[3] is not None and entry[3] <= self.clock()
+    
+    def get(self, key, default=None):
+        """查询键，命中时移动到链表头部"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        
+        if self._expired(entry):
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        
+        self.order.move_to_first(entry[0])
+        self.hits += 1
+        return entry[1]
+    
+    def put(self, key, value):
+        """写入键值，超出容量或字节上限时从尾部淘汰"""
+        nbytes = self.sizeof(value) if self.max_bytes is not None else 0
+        expires_at = self.clock() + self.ttl if self.ttl is not None else None
+        
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.total_bytes += nbytes - entry[2]
+            entry[1:] = [value, nbytes, expires_at]
+            self.order.move_to_first(entry[0])
+        else:
+            node = self.order.add_frist(key)
+            self.entries[key] = [node, value, nbytes, expires_at]
+            self.total_bytes += nbytes
+        
+        while self.entries and (len(self.entries) > self.capacity or
+                                (self.max_bytes is not None and self.total_bytes > self.max_bytes)):
+            self._remove(self.order.tail.prev.val)
+            self.evictions += 1
+    
+    def pop(self, key, default=None):
+        """删除键并返回其值"""
+        if key not in self.entries:
+            return default
+        return self._remove(key)
+    
+    def _remove(self, key):
+        """删除键对应的条目并返回其值"""
+        node, value, nbytes, _ = self.entries.pop(key)
+        self.order.remove_node(node)
+        self.total_bytes -= nbytes
+        return value
+    
+    def purge_expired(self):
+        """
+        主动清理所有过期条目
+        时间复杂度：O(n)
+        """
+        for key in [k for k, entry in self.entries.items() if self._expired(entry)]:
+            self._remove(key)
+            self.expirations += 1
+    
+    def stats(self):
+        """返回命中、未命中、淘汰、过期计数"""
+        return {"hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "expirations": self.expirations}
+
+class LFUCache(LRUCache):
+    """
+    LFU缓存：哈希表 + 按访问频次分组的双向链表
+    淘汰访问次数最少的键，次数相同时淘汰其中最久未使用的
+    限制条件与统计计数同LRUCache
+    时间复杂度：get/put O(1)
+    """
+    def __init__(self, capacity=128, max_bytes=None, ttl=None, sizeof=sys.getsizeof, clock=time.monotonic):
+        super().__init__(capacity, max_bytes, ttl, sizeof, clock)
+        self.freq_lists = {} # 频次 -> 该频次键组成的双向链表
+        self.freqs = {}      # 键 -> 频次
+        self.min_freq = 0
+    
+    def get(self, key, default=None):
+        """查询键，命中时频次加一"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        
+        if self._expired(entry):
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        
+        self._touch(key, entry)
+        self.hits += 1
+        return entry[1]
+    
+    def put(self, key, value):
+        """写入键值，超出容量或字节上限时淘汰频次最低的键"""
+        nbytes = self.sizeof(value) if self.max_bytes is not None else 0
+        expires_at = self.clock() + self.ttl if self.ttl is not None else None
+        
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.total_bytes += nbytes - entry[2]
+            entry[1:] = [value, nbytes, expires_at]
+            self._touch(key, entry)
+        else:
+            # 先为新键腾出一个位置，避免新键刚插入就被淘汰；capacity为0时没有可淘汰的键
+            if self.entries and len(self.entries) >= self.capacity:
+                self._evict()
+            node = self._freq_list(1).add_frist(key)
+            self.entries[key] = [node, value, nbytes, expires_at]
+            self.freqs[key] = 1
+            self.min_freq = 1
+            self.total_bytes += nbytes
+        
+        while self.entries and (len(self.entries) > self.capacity or
+                                (self.max_bytes is not None and self.total_bytes > self.max_bytes)):
+            self._evict()
+    
+    def _freq_list(self, freq):
+        """取出访问频次freq对应的链表，不存在时创建"""
+        lst = self.freq_lists.get(freq)
+        if lst is None:
+            lst = self.freq_lists[freq] = DoublyLinkList()
+        return lst
+    
+    def _touch(self, key, entry):
+        """把键从当前频次链表移到频次加一的链表头部"""
+        freq = self.freqs[key]
+        lst = self.freq_lists[freq]
+        lst.remove_node(entry[0])
+        if lst.size == 0:
+            del self.freq_lists[freq]
+            if self.min_freq == freq:
+                self.min_freq = freq + 1
+        
+        self.freqs[key] = freq + 1
+        entry[0] = self._freq_list(freq + 1).add_frist(key)
+    
+    def _evict(self):
+        """淘汰频次最低的链表尾部的键"""
+        if self.min_freq not in self.freq_lists:
+            # 删除或过期后最小频次可能失效，重新计算
+            self.min_freq = min(self.freq_lists)
+        self._remove(self.freq_lists[self.min_freq].tail.prev.val)
+        self.evictions += 1
+    
+    def _remove(self, key):
+        """删除键对应的条目并返回其值，同步维护频次链表"""
+        node, value, nbytes, _ = self.entries.pop(key)
+        freq = self.freqs.pop(key)
+        lst = self.freq_lists[freq]
+        lst.remove_node(node)
+        if lst.size == 0:
+            del self.freq_lists[freq]
+        self.total_bytes -= nbytes
+        return value
+
+def memoize(cache=None):
+    """
+    缓存函数结果的装饰器，默认使用LRUCache()
+    参数必须可哈希；多个函数共用同一个cache时键可能冲突
+    被装饰函数的cache属性即所用的缓存，可用于查看统计
+    """
+    def decorator(func):
+        store = cache if cache is not None else LRUCache()
+        missing = object()
+        kwd_mark = object() # 分隔位置参数与关键字参数，避免f(1, a=2)与f((1,), (('a', 2),))得到同一个键
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args + (kwd_mark,) + tuple(sorted(kwargs.items())) if kwargs else args
+            value = store.get(key, missing)
+            if value is missing:
+                value = func(*args, **kwargs)
+                store.put(key, value)
+            return value
+        
+        wrapper.cache = store
+        return wrapper
+    return decorator
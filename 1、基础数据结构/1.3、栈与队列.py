@@ -1,3 +1,12 @@
+import asyncio
+import heapq
+import queue
+import threading
+import time
+from array import array
+from collections import deque
+from multiprocessing import shared_memory
+
 # 栈的多种实现
 class ArrayStack:
     """
@@ -36,6 +45,8 @@ class LinkStack:
     所有操作时间复杂度：O(1)
     """
     class Node:
+        __slots__ = ('val', 'next')
+        
         def __init__(self, val, next = None):
             self.val = val
             self.next = next
@@ -104,6 +115,7 @@ class MinStack:
         """获取栈顶元素"""
         if not self.stack:
             raise IndexError(" peek from empty stack")
+        return self.stack[-1]
         
     def get_min(self):
         """
@@ -114,26 +126,222 @@ class MinStack:
             raise IndexError(" stack is empty")
         return self.min_stack[-1]    
     
+# 压缩辅助栈的最值栈
+class CompressedMinStack:
+    """
+    MinStack的省内存版本：辅助栈只在最小值变化时记录(最小值, 次数)游程
+    - 入栈值小于当前最小值：新开一个游程
+    - 入栈值等于当前最小值：游程次数加一
+    - 入栈值大于当前最小值：辅助栈不变
+    出栈值等于当前最小值时次数减一，减到0弹出游程
+    游程拆成两个并列列表存放，避免每个游程一个元组/列表对象
+    时间复杂度：push/pop/peek/get_min O(1)
+    空间复杂度：O(n + k)，k为最小值变化次数，最坏（严格递减输入）与MinStack相同
+    """
+    def __init__(self):
+        self.stack = []
+        self.min_values = []    # 各游程的最小值
+        self.min_counts = []    # 各游程中该最小值在主栈里出现的次数
+    
+    def __len__(self):
+        """返回栈的大小"""
+        return len(self.stack)
+    
+    def push(self, val):
+        """入栈"""
+        self.stack.append(val)
+        mins = self.min_values
+        if not mins or val < mins[-1]:
+            mins.append(val)
+            self.min_counts.append(1)
+        elif val == mins[-1]:
+            self.min_counts[-1] += 1
+    
+    def pop(self):
+        """出栈"""
+        if not self.stack:
+            raise IndexError(" pop from empty stack")
+        val = self.stack.pop()
+        if val == self.min_values[-1]:
+            self.min_counts[-1] -= 1
+            if not self.min_counts[-1]:
+                self.min_values.pop()
+                self.min_counts.pop()
+        return val
+    
+    def peek(self):
+        """获取栈顶元素"""
+        if not self.stack:
+            raise IndexError(" peek from empty stack")
+        return self.stack[-1]
+    
+    def get_min(self):
+        """获取栈中的最小值"""
+        if not self.min_values:
+            raise IndexError(" stack is empty")
+        return self.min_values[-1]
+    
+    def is_empty(self):
+        """判断栈是否为空"""
+        return not self.stack
+    
+    def size(self):
+        """返回栈的大小"""
+        return len(self.stack)
+
+class MinMaxStack(CompressedMinStack):
+    """
+    同时支持O(1)获取最小值和最大值的栈
+    最大值一侧用与最小值对称的(最大值, 次数)游程压缩
+    """
+    def __init__(self):
+        super().__init__()
+        self.max_values = []
+        self.max_counts = []
+    
+    def push(self, val):
+        """入栈，两侧游程的更新内联以省去super()调用"""
+        self.stack.append(val)
+        mins = self.min_values
+        if not mins or val < mins[-1]:
+            mins.append(val)
+            self.min_counts.append(1)
+        elif val == mins[-1]:
+            self.min_counts[-1] += 1
+        maxs = self.max_values
+        if not maxs or val > maxs[-1]:
+            maxs.append(val)
+            self.max_counts.append(1)
+        elif val == maxs[-1]:
+            self.max_counts[-1] += 1
+    
+    def pop(self):
+        """出栈"""
+        if not self.stack:
+            raise IndexError(" pop from empty stack")
+        val = self.stack.pop()
+        if val == self.min_values[-1]:
+            self.min_counts[-1] -= 1
+            if not self.min_counts[-1]:
+                self.min_values.pop()
+                self.min_counts.pop()
+        if val == self.max_values[-1]:
+            self.max_counts[-1] -= 1
+            if not self.max_counts[-1]:
+                self.max_values.pop()
+                self.max_counts.pop()
+        return val
+    
+    def get_max(self):
+        """获取栈中的最大值"""
+        if not self.max_values:
+            raise IndexError(" stack is empty")
+        return self.max_values[-1]
+
+class AggregateStack:
+    """
+    维护任意结合律运算（sum、min、max、gcd、矩阵乘等）栈内聚合值的栈
+    思路：第i个位置的聚合值 = op(第i-1个位置的聚合值, 第i个元素)，出栈后聚合值自然回退到上一个位置
+    compress=True时相邻位置聚合值相等则合并成(聚合值, 次数)游程，
+    min/max/gcd这类幂等运算大部分入栈不会改变聚合值，辅助栈远小于主栈；
+    合并需要聚合值支持返回bool的==，numpy数组等逐元素比较的类型请保持compress=False
+    只要求op满足结合律，不要求交换律；聚合顺序为从栈底到栈顶
+    时间复杂度：push/pop/query O(1)（加一次op调用）
+    """
+    def __init__(self, op, iterable=(), compress=False):
+        self.op = op
+        self.compress = compress
+        self.stack = []
+        self.agg_values = []    # 前缀聚合值的游程
+        self.agg_counts = []    # 各游程覆盖的主栈元素个数
+        for val in iterable:
+            self.push(val)
+    
+    def __len__(self):
+        """返回栈的大小"""
+        return len(self.stack)
+    
+    def push(self, val):
+        """入栈"""
+        self.stack.append(val)
+        aggs = self.agg_values
+        if not aggs:
+            aggs.append(val)
+            self.agg_counts.append(1)
+            return
+        agg = self.op(aggs[-1], val)
+        if self.compress and agg == aggs[-1]:
+            self.agg_counts[-1] += 1
+        else:
+            aggs.append(agg)
+            self.agg_counts.append(1)
+    
+    def pop(self):
+        """出栈"""
+        if not self.stack:
+            raise IndexError(" pop from empty stack")
+        self.agg_counts[-1] -= 1
+        if not self.agg_counts[-1]:
+            self.agg_values.pop()
+            self.agg_counts.pop()
+        return self.stack.pop()
+    
+    def peek(self):
+        """获取栈顶元素"""
+        if not self.stack:
+            raise IndexError(" peek from empty stack")
+        return self.stack[-1]
+    
+    def query(self):
+        """返回栈内全部元素的聚合值"""
+        if not self.agg_values:
+            raise IndexError(" stack is empty")
+        return self.agg_values[-1]
+    
+    def is_empty(self):
+        """判断栈是否为空"""
+        return not self.stack
+    
+    def size(self):
+        """返回栈的大小"""
+        return len(self.stack)
+    
 # 队列的多种实现
 class ArrayQueue:
     """
     基于循环数组的队列实现
     避免了普通数组实现中的元素移动
+    缩容策略：元素个数低于capacity * shrink_at时容量减半，但不低于初始容量；
+    shrink_at为0时不缩容，突发负载下可调小以避免反复扩缩；
+    shrink_at不能超过0.5，否则减半后的容量会小于元素个数
     """
-    def __init__(self, capacity = 10):
+    def __init__(self, capacity = 10, shrink_at = 0.25):
+        if not 0 <= shrink_at <= 0.5:
+            raise ValueError("shrink_at must be in [0, 0.5]")
         self.capacity = capacity
+        self.min_capacity = capacity # 缩容下限
+        self.shrink_at = shrink_at
         self.items = [None] * capacity
         self.front = 0 # 队首指针
         self.rear = 0  # 队尾指针
         self.size = 0
         
+    def __len__(self):
+        """返回队列长度"""
+        return self.size
+    
+    def __iter__(self):
+        """从队首到队尾遍历"""
+        for i in range(self.size):
+            yield self.items[(self.front + i) % self.capacity]
+        
     def enqueue(self, item):
         """
         入队
         时间复杂度：O(1)
         """
         if self.size == self.capacity:
-            self._resize(2 * self.capacity)
+            self._resize(max(1, 2 * self.capacity)) # 容量为0时翻倍仍为0
             
         self.items[self.rear] = item
         self.rear = (self.rear + 1) % self.capacity
@@ -152,11 +360,44 @@ class ArrayQueue:
         self.front = (self.front + 1) % self.capacity
         self.size  -= 1
         
-        if 0 < self.size < self.capacity // 4:
-            self._resize(self.capacity // 2)
+        self._maybe_shrink()
         
         return item
     
+    def extend(self, iterable):
+        """
+        批量入队：最多扩容一次，按连续段整段复制
+        时间复杂度：O(k)
+        """
+        values = iterable if isinstance(iterable, (list, tuple)) else list(iterable)
+        if not values:
+            return # 容量为0时_write_many会对0取模
+        if self.size + len(values) > self.capacity:
+            new_capacity = max(1, self.capacity)
+            while new_capacity < self.size + len(values):
+                new_capacity *= 2
+            self._resize(new_capacity)
+        self._write_many(values)
+    
+    def dequeue_many(self, k):
+        """
+        批量出队：取出最多k个元素，按连续段整段复制
+        时间复杂度：O(k)
+        """
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        if self.is_empty():
+            raise IndexError("dequeue from empty queue")
+        
+        items = self._read_many(min(k, self.size))
+        self._maybe_shrink()
+        return items
+    
+    def _maybe_shrink(self):
+        """按缩容策略检查是否需要缩容"""
+        while 0 < self.size < self.capacity * self.shrink_at and self.capacity // 2 >= self.min_capacity:
+            self._resize(self.capacity // 2)
+    
     def peek(self):
         """查看队首元素"""
         if self.is_empty():
@@ -166,19 +407,857 @@ class ArrayQueue:
     def is_empty(self):
         """判断队列是否为空"""
         return self.size == 0
+    
+    def _push(self, item):
+        """
+        把item写入队尾，不扩容
+        调用方需保证队列未满
+        """
+        self.items[self.rear] = item
+        self.rear = (self.rear + 1) % self.capacity
+        self.size += 1
+    
+    def _pop(self):
+        """
+        取出队首元素并清空槽位，不缩容
+        调用方需保证队列非空
+        """
+        item = self.items[self.front]
+        self.items[self.front] = None # 避免内存泄漏
+        self.front = (self.front + 1) % self.capacity
+        self.size -= 1
+        return item
+    
+    def _write_many(self, values):
+        """
+        把values写入队尾，最多分两段切片复制（队尾到数组末尾、数组开头）
+        调用方需保证剩余容量足够
+        """
+        k = len(values)
+        first = min(k, self.capacity - self.rear)
+        self.items[self.rear:self.rear + first] = values[:first]
+        self.items[:k - first] = values[first:]
+        self.rear = (self.rear + k) % self.capacity
+        self.size += k
+    
+    def _read_many(self, k):
+        """
+        从队首取出k个元素，最多分两段切片复制，并清空对应槽位
+        调用方需保证元素个数足够
+        """
+        first = min(k, self.capacity - self.front)
+        result = self.items[self.front:self.front + first] + self.items[:k - first]
+        self.items[self.front:self.front + first] = [None] * first # 避免内存泄漏
+        self.items[:k - first] = [None] * (k - first)
+        self.front = (self.front + k) % self.capacity
+        self.size -= k
+        return result
+    
     def _resize(self, new_capacity):
         """调整队列容量"""
         new_items = [None] * new_capacity
         
-        # 复制元素到新数组
-        for i in range(self.size):
-            new_items[i] = self.items[(self.front + i) % self.capacity]
+        # 复制元素到新数组：队首到数组末尾、数组开头到队尾，最多两段切片
+        first = min(self.size, self.capacity - self.front)
+        new_items[:first] = self.items[self.front:self.front + first]
+        new_items[first:self.size] = self.items[:self.size - first]
         
         self.items = new_items
         self.capacity = new_capacity
         self.front = 0
         self.rear = self.size
         
+class PowerOfTwoArrayQueue(ArrayQueue):
+    """
+    容量始终为2的幂的循环数组队列
+    入队出队用位与掩码代替取模；扩容翻倍、缩容减半都保持2的幂
+    """
+    def __init__(self, capacity = 16, shrink_at = 0.25):
+        # 向上取整到2的幂
+        super().__init__(1 << max(capacity - 1, 0).bit_length(), shrink_at)
+    
+    def enqueue(self, item):
+        """
+        入队
+        时间复杂度：O(1)
+        """
+        if self.size == self.capacity:
+            self._resize(2 * self.capacity)
+        
+        self.items[self.rear] = item
+        self.rear = (self.rear + 1) & (self.capacity - 1)
+        self.size += 1
+    
+    def dequeue(self):
+        """
+        出队
+        时间复杂度：O(1)
+        """
+        if self.size == 0:
+            raise IndexError("dequeue from empty queue")
+        
+        item = self.items[self.front]
+        self.items[self.front] = None # 避免内存泄漏
+        self.front = (self.front + 1) & (self.capacity - 1)
+        self.size -= 1
+        
+        if self.size < self.capacity * self.shrink_at:
+            self._maybe_shrink()
+        
+        return item
+
+# 双端循环队列
+class RingDeque(ArrayQueue):
+    """
+    基于循环数组的双端队列，两端插入删除O(1)
+    与collections.deque不同，按下标访问任意位置都是O(1)
+    指定maxlen时容量固定，队满后从一端插入会覆盖另一端最旧的元素
+    """
+    def __init__(self, iterable=(), maxlen=None, capacity=10):
+        if maxlen is not None and maxlen <= 0:
+            raise ValueError("maxlen must be positive")
+        super().__init__(maxlen if maxlen is not None else capacity)
+        self.maxlen = maxlen
+        self.extend(iterable)
+    
+    def _index(self, index):
+        """逻辑下标（支持负数）转换为底层数组下标"""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("deque index out of range")
+        return (self.front + index) % self.capacity
+    
+    def __getitem__(self, index):
+        """
+        按下标访问
+        时间复杂度：O(1)
+        """
+        return self.items[self._index(index)]
+    
+    def __setitem__(self, index, value):
+        """按下标赋值"""
+        self.items[self._index(index)] = value
+    
+    def push_back(self, item):
+        """
+        队尾插入
+        时间复杂度：O(1)
+        """
+        if self.size == self.capacity and self.maxlen is not None:
+            self.pop_front() # 覆盖最旧的队首元素
+        super().enqueue(item)
+    
+    def enqueue(self, item):
+        """入队即队尾插入，经过push_back以遵守maxlen"""
+        self.push_back(item)
+    
+    def push_front(self, item):
+        """
+        队首插入
+        时间复杂度：O(1) 摊还
+        """
+        if self.size == self.capacity:
+            if self.maxlen is not None:
+                self.pop_back() # 覆盖队尾元素
+            else:
+                self._resize(max(1, 2 * self.capacity))
+        
+        self.front = (self.front - 1) % self.capacity
+        self.items[self.front] = item
+        self.size += 1
+    
+    def pop_front(self):
+        """队首删除"""
+        return self.dequeue()
+    
+    def pop_back(self):
+        """
+        队尾删除
+        时间复杂度：O(1)
+        """
+        if self.is_empty():
+            raise IndexError("pop from empty deque")
+        
+        self.rear = (self.rear - 1) % self.capacity
+        item = self.items[self.rear]
+        self.items[self.rear] = None # 避免内存泄漏
+        self.size -= 1
+        
+        self._maybe_shrink()
+        
+        return item
+    
+    def peek_back(self):
+        """查看队尾元素"""
+        if self.is_empty():
+            raise IndexError(" peek from empty deque")
+        return self.items[(self.rear - 1) % self.capacity]
+    
+    def extend(self, iterable):
+        """队尾批量插入；指定maxlen时只保留最后maxlen个"""
+        if self.maxlen is None:
+            super().extend(iterable)
+            return
+        for item in iterable:
+            self.push_back(item)
+    
+    def rotate(self, n=1):
+        """
+        向右旋转n步（n为负数时向左），与collections.deque.rotate一致
+        队满时只移动指针，时间复杂度O(1)；否则移动min(n, size-n)个元素
+        """
+        if self.size <= 1:
+            return
+        n %= self.size
+        if n == 0:
+            return
+        
+        if self.size == self.capacity:
+            self.front = (self.front - n) % self.capacity
+            self.rear = self.front
+            return
+        
+        items, cap = self.items, self.capacity
+        if n <= self.size // 2:
+            # 把队尾n个元素逐个搬到队首
+            for _ in range(n):
+                self.rear = (self.rear - 1) % cap
+                self.front = (self.front - 1) % cap
+                items[self.front] = items[self.rear]
+                items[self.rear] = None
+        else:
+            # 等价于向左旋转size-n步：把队首元素逐个搬到队尾
+            for _ in range(self.size - n):
+                items[self.rear] = items[self.front]
+                items[self.front] = None
+                self.front = (self.front + 1) % cap
+                self.rear = (self.rear + 1) % cap
+
+# 线程安全的有界队列
+class ConcurrentArrayQueue:
+    """
+    基于ArrayQueue的线程安全有界队列
+    容量固定为maxsize，不再扩容缩容；队列满时put阻塞，队列空时get阻塞
+    超时抛出queue.Full/queue.Empty，与标准库queue.Queue一致
+    put_many/get_many一次加锁处理一批元素，按环形数组的连续段整段复制
+    """
+    def __init__(self, maxsize=1024):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._queue = ArrayQueue(maxsize)
+        self.mutex = threading.Lock()
+        self.not_empty = threading.Condition(self.mutex)
+        self.not_full = threading.Condition(self.mutex)
+    
+    def qsize(self):
+        """当前元素个数"""
+        return self._queue.size
+    
+    def empty(self):
+        """判断队列是否为空（返回时结果可能已过期）"""
+        return self._queue.size == 0
+    
+    def full(self):
+        """判断队列是否已满（返回时结果可能已过期）"""
+        return self._queue.size == self.maxsize
+    
+    def _wait(self, condition, predicate, block, deadline, error):
+        """在condition上等待predicate成立，非阻塞或超时时抛出error"""
+        while not predicate():
+            if not block:
+                raise error
+            if deadline is None:
+                condition.wait()
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise error
+                condition.wait(remaining)
+    
+    @staticmethod
+    def _deadline(timeout):
+        """把超时秒数换算为monotonic截止时间，None表示一直等待"""
+        if timeout is None:
+            return None
+        if timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        return time.monotonic() + timeout
+    
+    def put(self, item, block=True, timeout=None):
+        """入队，队列满时阻塞至多timeout秒"""
+        deadline = self._deadline(timeout)
+        with self.not_full:
+            q = self._queue
+            if q.size == self.maxsize:
+                self._wait(self.not_full, lambda: q.size < self.maxsize, block, deadline, queue.Full)
+            q._push(item)
+            self.not_empty.notify()
+    
+    def get(self, block=True, timeout=None):
+        """出队，队列空时阻塞至多timeout秒"""
+        deadline = self._deadline(timeout)
+        with self.not_empty:
+            q = self._queue
+            if q.size == 0:
+                self._wait(self.not_empty, lambda: q.size > 0, block, deadline, queue.Empty)
+            item = q._pop()
+            self.not_full.notify()
+            return item
+    
+    def put_many(self, items, block=True, timeout=None):
+        """
+        批量入队：每次有空位时把尽可能多的元素整段写入
+        超时抛出queue.Full时，已写入的元素保留在队列中
+        """
+        items = items if isinstance(items, (list, tuple)) else list(items)
+        deadline = self._deadline(timeout)
+        start = 0
+        with self.not_full:
+            while start < len(items):
+                self._wait(self.not_full, lambda: self._queue.size < self.maxsize, block, deadline, queue.Full)
+                k = min(self.maxsize - self._queue.size, len(items) - start)
+                self._queue._write_many(items[start:start + k])
+                start += k
+                self.not_empty.notify(k)
+    
+    def get_many(self, max_items, block=True, timeout=None):
+        """批量出队：至少等到一个元素，然后一次取出最多max_items个"""
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        deadline = self._deadline(timeout)
+        with self.not_empty:
+            self._wait(self.not_empty, lambda: self._queue.size > 0, block, deadline, queue.Empty)
+            items = self._queue._read_many(min(max_items, self._queue.size))
+            self.not_full.notify(len(items))
+            return items
+
+# asyncio版本的有界队列
+class AsyncArrayQueue:
+    """
+    基于ArrayQueue的asyncio有界队列，只能在同一个事件循环内使用
+    put/get在满/空时挂起，超时用asyncio.wait_for包装
+    put_many/get_many按环形数组的连续段整段复制
+    """
+    def __init__(self, maxsize=1024):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._queue = ArrayQueue(maxsize)
+        self._getters = deque() # 等待元素的future
+        self._putters = deque() # 等待空位的future
+    
+    def qsize(self):
+        """返回队列中的元素个数"""
+        return self._queue.size
+    
+    def empty(self):
+        """判断队列是否为空"""
+        return self._queue.size == 0
+    
+    def full(self):
+        """判断队列是否已满"""
+        return self._queue.size == self.maxsize
+    
+    @staticmethod
+    def _wakeup_next(waiters):
+        """唤醒一个仍在等待的协程"""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+    
+    async def _wait(self, waiters, ready):
+        """挂起直到ready()成立；被取消时把唤醒机会转交给下一个等待者"""
+        loop = asyncio.get_running_loop()
+        while not ready():
+            waiter = loop.create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if ready() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+                raise
+    
+    def put_nowait(self, item):
+        """不等待地入队，队满时抛出asyncio.QueueFull"""
+        q = self._queue
+        if q.size == self.maxsize:
+            raise asyncio.QueueFull
+        q._push(item)
+        if self._getters:
+            self._wakeup_next(self._getters)
+    
+    def get_nowait(self):
+        """不等待地出队，队空时抛出asyncio.QueueEmpty"""
+        q = self._queue
+        if q.size == 0:
+            raise asyncio.QueueEmpty
+        item = q._pop()
+        if self._putters:
+            self._wakeup_next(self._putters)
+        return item
+    
+    async def put(self, item):
+        """入队，队列满时挂起"""
+        if self.full():
+            await self._wait(self._putters, lambda: not self.full())
+        self.put_nowait(item)
+    
+    async def get(self):
+        """出队，队列空时挂起"""
+        if self.empty():
+            await self._wait(self._getters, lambda: not self.empty())
+        return self.get_nowait()
+    
+    async def put_many(self, items):
+        """批量入队：每次有空位时把尽可能多的元素整段写入"""
+        items = items if isinstance(items, (list, tuple)) else list(items)
+        start = 0
+        while start < len(items):
+            await self._wait(self._putters, lambda: not self.full())
+            k = min(self.maxsize - self._queue.size, len(items) - start)
+            self._queue._write_many(items[start:start + k])
+            start += k
+            for _ in range(k):
+                self._wakeup_next(self._getters)
+    
+    async def get_many(self, max_items):
+        """批量出队：至少等到一个元素，然后一次取出最多max_items个"""
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        await self._wait(self._getters, lambda: not self.empty())
+        items = self._queue._read_many(min(max_items, self._queue.size))
+        for _ in range(len(items)):
+            self._wakeup_next(self._putters)
+        return items
+        
+# 跨进程的单生产者单消费者环形缓冲区
+class SharedRingBuffer:
+    """
+    基于multiprocessing.shared_memory的SPSC（单生产者单消费者）环形缓冲区
+    记录为变长字节串，格式为4字节长度前缀 + 数据，按4字节对齐
+    容量为2的幂，用位与掩码代替取模；head只由消费者写、tail只由生产者写，无需加锁
+    记录放不下数组末尾的剩余空间时写入回绕标记并从头开始，保证每条记录连续存放，
+    因此消费者可以通过peek零拷贝地拿到memoryview
+    单条记录（含长度前缀）不能超过容量的一半
+    
+    共享内存布局：
+    - [0, 8)：head 消费者已读到的位置（单调递增）
+    - [64, 72)：tail 生产者已写到的位置（单调递增），与head分处不同缓存行
+    - [120, 128)：容量
+    - [128, 128 + capacity)：数据区
+    
+    依赖CPython对齐的8字节写入不被拆分、且生产者先写数据再发布tail（x86等强内存序平台成立）
+    """
+    HEADER = 128
+    WRAP = 0xFFFFFFFF # 回绕标记
+    
+    def __init__(self, capacity=1 << 20, name=None, create=True):
+        if create:
+            if capacity < 8 or capacity & (capacity - 1):
+                raise ValueError("capacity must be a power of two >= 8")
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=self.HEADER + capacity)
+        else:
+            self.shm = self._attach(name)
+        
+        buf = self.shm.buf
+        self._ctrl = buf[:self.HEADER].cast('Q')  # 控制字：head、tail、容量
+        if create:
+            self._ctrl[0] = self._ctrl[8] = 0
+            self._ctrl[15] = capacity
+        self.capacity = self._ctrl[15]
+        self.mask = self.capacity - 1
+        self._data = buf[self.HEADER:self.HEADER + self.capacity]
+        self._words = self._data.cast('I')  # 按4字节访问长度前缀
+        
+        # 各自维护本地副本，只有发布时才写共享内存
+        self._head = self._ctrl[0]
+        self._tail = self._ctrl[8]
+        self._pending = None # peek后尚未释放的记录的结束位置
+    
+    @staticmethod
+    def _attach(name):
+        """按名字连接已有的共享内存，由创建方负责unlink"""
+        try:
+            # Python 3.13+：不交给resource_tracker管理，避免连接方退出时误删
+            return shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # 更早的版本没有track参数；由multiprocessing启动的子进程与父进程共用resource_tracker，不会提前删除
+            return shared_memory.SharedMemory(name=name)
+    
+    @property
+    def name(self):
+        """共享内存名字，另一个进程用SharedRingBuffer(name=..., create=False)连接"""
+        return self.shm.name
+    
+    def __len__(self):
+        """已占用的字节数（含长度前缀和填充）"""
+        return self._ctrl[8] - self._ctrl[0]
+    
+    def try_put(self, data):
+        """
+        生产者写入一条记录，空间不足时返回False
+        时间复杂度：O(len(data)) 一次切片复制
+        """
+        if not isinstance(data, bytes):
+            data = memoryview(data).cast('B')
+        n = len(data)
+        need = 4 + ((n + 3) & ~3)
+        if need > self.capacity >> 1:
+            # 回绕的记录最多占用 room_to_end + need 字节，且 room_to_end < need；
+            # need不超过容量一半才能保证空缓冲区一定放得下，否则put会永远等待
+            raise ValueError("record larger than half the buffer capacity")
+        
+        tail = self._tail
+        off = tail & self.mask
+        room_to_end = self.capacity - off
+        total = need if need <= room_to_end else room_to_end + need
+        if self.capacity - (tail - self._ctrl[0]) < total:
+            return False
+        
+        if need > room_to_end:
+            # 末尾放不下，写回绕标记后从头开始
+            self._words[off >> 2] = self.WRAP
+            tail += room_to_end
+            off = 0
+        
+        self._data[off + 4:off + 4 + n] = data
+        self._words[off >> 2] = n
+        self._tail = tail + need
+        self._ctrl[8] = self._tail # 数据写完后再发布tail
+        return True
+    
+    def peek(self):
+        """
+        消费者查看下一条记录，返回指向共享内存的memoryview，没有记录时返回None
+        返回的视图在release之前有效，release之后可能被生产者覆盖
+        """
+        if self._pending is not None:
+            raise RuntimeError("release() the previous record before peeking again")
+        
+        head = self._head
+        if head == self._ctrl[8]:
+            return None
+        
+        off = head & self.mask
+        n = self._words[off >> 2]
+        if n == self.WRAP:
+            head += self.capacity - off
+            off = 0
+            n = self._words[0]
+        
+        self._head = head
+        self._pending = head + 4 + ((n + 3) & ~3)
+        return self._data[off + 4:off + 4 + n]
+    
+    def release(self):
+        """释放peek得到的记录，把空间还给生产者"""
+        if self._pending is None:
+            return
+        self._head = self._pending
+        self._pending = None
+        self._ctrl[0] = self._head
+    
+    def try_get(self):
+        """消费者取出一条记录的副本，没有记录时返回None"""
+        view = self.peek()
+        if view is None:
+            return None
+        data = bytes(view)
+        view.release()
+        self.release()
+        return data
+    
+    def put(self, data, timeout=None):
+        """写入一条记录，空间不足时让出CPU重试，超时抛出queue.Full"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.try_put(data):
+            if deadline is not None and time.monotonic() >= deadline:
+                raise queue.Full
+            time.sleep(0)
+    
+    def get(self, timeout=None):
+        """取出一条记录，没有记录时让出CPU重试，超时抛出queue.Empty"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            data = self.try_get()
+            if data is not None:
+                return data
+            if deadline is not None and time.monotonic() >= deadline:
+                raise queue.Empty
+            time.sleep(0)
+    
+    def close(self):
+        """释放本进程持有的视图并关闭共享内存；peek得到的视图需先自行release"""
+        self._words.release()
+        self._data.release()
+        self._ctrl.release()
+        self.shm.close()
+    
+    def unlink(self):
+        """删除共享内存，由创建方在双方都close之后调用"""
+        self.shm.unlink()
+        
+# 优先队列
+class DaryHeap:
+    """
+    d叉最小堆实现的优先队列，d=2即二叉堆
+    元素默认以(优先级, 插入序号, 值)存储，优先级相同时先入先出，且不会去比较值本身
+    stable=False时省去插入序号，以(优先级, 值)存储，每个条目少一个字段、比较更快，
+    但优先级相同时会比较值，值不可比较（如dict）时抛出TypeError，只适合值可比较或优先级不重复的场景
+    d越大树越矮，入堆更快、出堆每层比较的孩子更多
+    d=2时条目布局与heapq一致，直接调用C实现的heapq函数
+    时间复杂度：
+    - push O(log_d n)
+    - pop O(d*log_d n)
+    - peek O(1)
+    - 批量建堆 O(n)
+    """
+    def __init__(self, iterable=(), d=2, stable=True):
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        self.d = d
+        self.stable = stable
+        self._counter = 0 # 插入序号
+        self.heap = []
+        self.heapify(iterable)
+    
+    def __len__(self):
+        """返回堆中的元素个数"""
+        return len(self.heap)
+    
+    def is_empty(self):
+        """判断堆是否为空"""
+        return not self.heap
+    
+    def _entry(self, priority, item):
+        """构造堆条目，stable时插入序号位于优先级和值之间"""
+        if self.stable:
+            self._counter += 1
+            return (priority, self._counter, item)
+        return (priority, item)
+    
+    def heapify(self, iterable):
+        """
+        批量加入(优先级, 值)并自底向上重新建堆
+        时间复杂度：O(n)
+        """
+        self.heap.extend(self._entry(priority, item) for priority, item in iterable)
+        if self.d == 2:
+            heapq.heapify(self.heap)
+            return
+        for i in range((len(self.heap) - 2) // self.d, -1, -1):
+            self._sift_down(i)
+    
+    def push(self, priority, item=None):
+        """入堆"""
+        if self.d == 2:
+            heapq.heappush(self.heap, self._entry(priority, item))
+            return
+        self.heap.append(self._entry(priority, item))
+        self._sift_up(len(self.heap) - 1)
+    
+    def pop(self):
+        """弹出优先级最小的元素，返回(优先级, 值)"""
+        if not self.heap:
+            raise IndexError("pop from empty heap")
+        
+        if self.d == 2:
+            top = heapq.heappop(self.heap)
+            return top[0], top[-1]
+        
+        last = self.heap.pop()
+        if not self.heap:
+            return last[0], last[-1]
+        top = self.heap[0]
+        self.heap[0] = last
+        self._sift_down(0)
+        return top[0], top[-1]
+    
+    def peek(self):
+        """查看优先级最小的元素"""
+        if not self.heap:
+            raise IndexError("peek from empty heap")
+        return self.heap[0][0], self.heap[0][-1]
+    
+    def _sift_up(self, i):
+        """上浮：空出位置逐层下移父节点，最后一次写入"""
+        heap, d = self.heap, self.d
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if entry < heap[parent]:
+                heap[i] = heap[parent]
+                i = parent
+            else:
+                break
+        heap[i] = entry
+    
+    def _sift_down(self, i):
+        """下沉：每层选出最小的孩子"""
+        heap, d = self.heap, self.d
+        n = len(heap)
+        entry = heap[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            best = first
+            for c in range(first + 1, min(first + d, n)):
+                if heap[c] < heap[best]:
+                    best = c
+            if heap[best] < entry:
+                heap[i] = heap[best]
+                i = best
+            else:
+                break
+        heap[i] = entry
+
+class IndexedHeap:
+    """
+    支持按句柄修改优先级和删除的d叉最小堆
+    push返回句柄，之后可O(log n)地decrease_key/update/remove
+    优先级相同时先入先出
+    """
+    class Handle:
+        __slots__ = ('priority', 'seq', 'item', 'pos')
+        
+        def __init__(self, priority, seq, item):
+            self.priority = priority
+            self.seq = seq   # 插入序号，用于稳定排序
+            self.item = item
+            self.pos = -1    # 在堆数组中的位置，-1表示已不在堆中
+        
+        def __lt__(self, other):
+            """先比较优先级，相同时比较插入序号"""
+            return (self.priority, self.seq) < (other.priority, other.seq)
+    
+    def __init__(self, d=2):
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        self.d = d
+        self.heap = []
+        self._counter = 0
+    
+    def __len__(self):
+        """返回堆中的元素个数"""
+        return len(self.heap)
+    
+    def __contains__(self, handle):
+        """判断句柄是否仍在堆中"""
+        return 0 <= handle.pos < len(self.heap) and self.heap[handle.pos] is handle
+    
+    def is_empty(self):
+        """判断堆是否为空"""
+        return not self.heap
+    
+    def push(self, priority, item=None):
+        """入堆，返回句柄"""
+        self._counter += 1
+        handle = self.Handle(priority, self._counter, item)
+        handle.pos = len(self.heap)
+        self.heap.append(handle)
+        self._sift_up(handle.pos)
+        return handle
+    
+    def peek(self):
+        """查看优先级最小的元素"""
+        if not self.heap:
+            raise IndexError("peek from empty heap")
+        return self.heap[0].priority, self.heap[0].item
+    
+    def pop(self):
+        """弹出优先级最小的元素，返回(优先级, 值)"""
+        if not self.heap:
+            raise IndexError("pop from empty heap")
+        return self.remove(self.heap[0])
+    
+    def decrease_key(self, handle, priority):
+        """
+        降低句柄对应元素的优先级
+        时间复杂度：O(log_d n)
+        """
+        if priority > handle.priority:
+            raise ValueError("new priority is greater than current priority")
+        self.update(handle, priority)
+    
+    def update(self, handle, priority):
+        """修改句柄对应元素的优先级，按变化方向上浮或下沉"""
+        if handle not in self:
+            raise KeyError("handle is not in the heap")
+        old = handle.priority
+        handle.priority = priority
+        if priority < old:
+            self._sift_up(handle.pos)
+        else:
+            self._sift_down(handle.pos)
+    
+    def remove(self, handle):
+        """
+        删除句柄对应的元素，返回(优先级, 值)
+        时间复杂度：O(d*log_d n)
+        """
+        if handle not in self:
+            raise KeyError("handle is not in the heap")
+        
+        i = handle.pos
+        last = self.heap.pop()
+        if last is not handle:
+            # 用末尾元素填补空位，再按需上浮或下沉
+            self.heap[i] = last
+            last.pos = i
+            self._sift_up(i)
+            if last.pos == i:
+                self._sift_down(i)
+        handle.pos = -1
+        return handle.priority, handle.item
+    
+    def _sift_up(self, i):
+        """上浮，移动的句柄同步更新pos"""
+        heap, d = self.heap, self.d
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if entry < heap[parent]:
+                heap[i] = heap[parent]
+                heap[i].pos = i
+                i = parent
+            else:
+                break
+        heap[i] = entry
+        entry.pos = i
+    
+    def _sift_down(self, i):
+        """下沉，每层选出最小的孩子，移动的句柄同步更新pos"""
+        heap, d = self.heap, self.d
+        n = len(heap)
+        entry = heap[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            best = first
+            for c in range(first + 1, min(first + d, n)):
+                if heap[c] < heap[best]:
+                    best = c
+            if heap[best] < entry:
+                heap[i] = heap[best]
+                heap[i].pos = i
+                i = best
+            else:
+                break
+        heap[i] = entry
+        entry.pos = i
+        
 # 单调栈与单调队列
 class MonotonicStack:
     """
@@ -273,6 +1352,217 @@ class MonotonicStack:
         
         return max_area
 
+    @staticmethod
+    def largest_rectangle(heights):
+        """
+        largest_rectangle_area的带坐标版本
+        返回(面积, 左端下标, 右端下标, 高度)，左右端均为闭区间；面积为0时坐标为-1
+        末尾追加一根高度为0的哨兵柱子，省去单独清空栈的循环
+        时间复杂度：O(n)
+        """
+        stack = []
+        best = (0, -1, -1, 0)
+        best_area = 0
+        
+        for i, h in enumerate(heights):
+            start = i
+            while stack and stack[-1][1] > h:
+                start, height = stack.pop()
+                area = height * (i - start)
+                if area > best_area:
+                    best_area = area
+                    best = (area, start, i - 1, height)
+            # 弹出的柱子都不比h矮，h可以向左延伸到最后一个被弹出柱子的位置
+            if not stack or stack[-1][1] < h:
+                stack.append((start, h))
+        
+        n = len(heights)
+        for start, height in stack:
+            area = height * (n - start)
+            if area > best_area:
+                best_area = area
+                best = (area, start, n - 1, height)
+        
+        return best
+    
+    @staticmethod
+    def _row_bits(row):
+        """
+        把一行转为0/1序列：str/bytes按'0'/'1'字符解析（忽略行尾换行符），
+        其他序列按元素真值解析
+        """
+        if isinstance(row, str):
+            return [c == '1' for c in row.rstrip('\r\n')]
+        if isinstance(row, (bytes, bytearray, memoryview)):
+            return [c == 49 for c in bytes(row).rstrip(b'\r\n')] # 49 == ord('1')
+        return row
+    
+    @staticmethod
+    def _maximal_rectangle_rows(first_row, heights_rows):
+        """对连续若干行的柱状图求最大矩形，返回(面积, (上, 左, 下, 右))；也是进程池任务"""
+        best_area, best_rect = 0, None
+        largest = MonotonicStack.largest_rectangle
+        for r, heights in enumerate(heights_rows, first_row):
+            area, left, right, height = largest(heights)
+            if area > best_area:
+                best_area, best_rect = area, (r - height + 1, left, r, right)
+        return best_area, best_rect
+    
+    @staticmethod
+    def maximal_rectangle(matrix, processes=1, chunk_rows=256):
+        """
+        二进制矩阵中全为1的最大矩形
+        逐行累积每列向上连续1的个数作为柱状图高度，每行调用一次largest_rectangle
+        matrix可以是任意行的可迭代对象（如逐行读取的文件、mmap的行迭代器），按流处理，
+        同一时刻只保留当前行的高度，不需要整个矩阵在内存中
+        processes不为1时（None表示CPU核数）由主进程累积高度，按chunk_rows行分块交给进程池求柱状图，
+        在途的块数有上限，内存占用仍与矩阵高度无关
+        返回(面积, (上, 左, 下, 右))，坐标为闭区间；没有1时返回(0, None)
+        时间复杂度：O(rows*cols)
+        空间复杂度：O(cols)，进程池模式为O(processes*chunk_rows*cols)
+        
+        示例：["10100","10111","11111","10010"] -> (6, (1, 2, 2, 4))
+        """
+        row_bits = MonotonicStack._row_bits
+        
+        def heights_stream():
+            heights = None
+            for row in matrix:
+                bits = row_bits(row)
+                if heights is None:
+                    heights = [1 if b else 0 for b in bits]
+                else:
+                    if len(bits) != len(heights):
+                        raise ValueError("all rows must have the same length")
+                    heights = [h + 1 if b else 0 for h, b in zip(heights, bits)]
+                yield heights
+        
+        if processes == 1:
+            return MonotonicStack._maximal_rectangle_rows(0, heights_stream())
+        
+        import os
+        from itertools import islice
+        from multiprocessing import Pool
+        
+        processes = processes or os.cpu_count() or 1
+        max_pending = 2 * processes
+        best = (0, None)
+        stream = heights_stream()
+        with Pool(processes) as pool:
+            pending = deque()
+            first_row = 0
+            while True:
+                chunk = list(islice(stream, chunk_rows))
+                if chunk:
+                    pending.append(pool.apply_async(MonotonicStack._maximal_rectangle_rows, (first_row, chunk)))
+                    first_row += len(chunk)
+                # 在途的块达到上限或输入结束时取回最早的结果，保证行顺序不影响并列最优时的选择
+                while pending and (len(pending) >= max_pending or not chunk):
+                    result = pending.popleft().get()
+                    if result[0] > best[0]:
+                        best = result
+                if not chunk:
+                    return best
+    
+    @staticmethod
+    def _batch_next_greater_index(arr):
+        """
+        批量求二维数组每一行中下一个严格更大元素的下标，没有时为-1
+        从右向左处理各列：位置i先看i+1，若不更大就沿已求出的"下一个更大"链向后跳，
+        跳过的正是单调栈中会被弹出的元素，总跳数与单调栈出栈次数相同
+        每一列上所有行一起跳，只对仍需继续跳的行做下一轮；数据转置为按列连续存放
+        """
+        import numpy as np
+        
+        rows_count, n = arr.shape
+        cols = np.arange(rows_count)
+        vals = np.zeros((n + 1, rows_count), dtype=arr.dtype)
+        vals[:n] = arr.T
+        nge = np.full((n + 1, rows_count), n, dtype=np.intp) # 第n行为哨兵，表示不存在
+        flat_vals, flat_nge = vals.ravel(), nge.ravel()
+        
+        for i in range(n - 2, -1, -1):
+            cur = vals[i]
+            j = np.full(rows_count, i + 1, dtype=np.intp)
+            active, jumps = cols, j
+            while active.size:
+                idx = jumps * rows_count + active
+                keep = (jumps < n) & (flat_vals[idx] <= cur[active])
+                active = active[keep]
+                jumps = flat_nge[idx[keep]]
+                j[active] = jumps
+            nge[i] = j
+        
+        result = nge[:n].T
+        return np.where(result < n, result, -1)
+    
+    @staticmethod
+    def _batch_rows(matrix, func, block_rows):
+        """按block_rows行分块调用func，控制辅助数组的大小"""
+        import numpy as np
+        
+        matrix = np.asarray(matrix)
+        if matrix.ndim != 2:
+            raise ValueError("expected a 2-D array with one series per row")
+        if matrix.shape[0] <= block_rows:
+            return func(matrix)
+        return np.concatenate([func(matrix[start:start + block_rows])
+                               for start in range(0, matrix.shape[0], block_rows)])
+    
+    @staticmethod
+    def next_greater_element_batch(matrix, block_rows=4096):
+        """
+        next_greater_element的批量版本：matrix每行是一条序列，返回同形状的NumPy数组
+        时间复杂度：O(rows*n) 摊还，循环只在列方向，行方向向量化
+        """
+        import numpy as np
+        
+        def run(block):
+            idx = MonotonicStack._batch_next_greater_index(block)
+            values = np.take_along_axis(block, np.maximum(idx, 0), axis=1)
+            # 无符号类型放不下-1，先提升为有符号类型
+            values = values.astype(np.result_type(block.dtype, np.int8))
+            return np.where(idx >= 0, values, -1)
+        
+        return MonotonicStack._batch_rows(matrix, run, block_rows)
+    
+    @staticmethod
+    def daily_temperatures_batch(matrix, block_rows=4096):
+        """
+        daily_temperatures的批量版本：matrix每行是一条温度序列，返回等待天数数组
+        时间复杂度：O(rows*n) 摊还
+        """
+        import numpy as np
+        
+        def run(block):
+            idx = MonotonicStack._batch_next_greater_index(block)
+            return np.where(idx >= 0, idx - np.arange(block.shape[1]), 0)
+        
+        return MonotonicStack._batch_rows(matrix, run, block_rows)
+    
+    @staticmethod
+    def largest_rectangle_area_batch(matrix, block_rows=4096):
+        """
+        largest_rectangle_area的批量版本：matrix每行是一个柱状图，返回每行的最大矩形面积
+        每根柱子向右延伸到下一个更矮的柱子、向左延伸到上一个更矮的柱子，
+        两个边界都由批量单调栈求出（取负后"更大"即"更矮"，左边界在翻转后的数组上求）
+        时间复杂度：O(rows*n) 摊还
+        """
+        import numpy as np
+        
+        def run(block):
+            n = block.shape[1]
+            if n == 0:
+                return np.zeros(block.shape[0], dtype=np.int64)
+            neg = -block.astype(np.float64 if block.dtype.kind == 'f' else np.int64) # 无符号整数取负前先转换
+            right = MonotonicStack._batch_next_greater_index(neg)
+            right = np.where(right >= 0, right, n)
+            left = MonotonicStack._batch_next_greater_index(neg[:, ::-1])[:, ::-1]
+            left = np.where(left >= 0, n - 1 - left, -1)
+            return (block * (right - left - 1)).max(axis=1)
+        
+        return MonotonicStack._batch_rows(matrix, run, block_rows)
+
 class MonotonicQueue:
     """
     单调队列：队列内元素保持单调性
@@ -338,4 +1628,338 @@ class MonotonicQueue:
             if i >= k - 1:
                 result.append(nums[dq[0]])
         
-        return result
\ No newline at end of file
+        return result
+    
+    @staticmethod
+    def sliding_window_stream(iterable, k):
+        """
+        滑动窗口最大值和最小值的流式版本，一次遍历同时得到两者
+        输入可以是任意迭代器（包括无限流），窗口形成后每来一个元素产出一次(最大值, 最小值)
+        时间复杂度：O(1) 摊还每个元素
+        空间复杂度：O(k)
+        """
+        window = SlidingWindow(size=k)
+        for x in iterable:
+            aggregates = window.push(x)
+            if window.full:
+                yield aggregates
+
+# 流式滑动窗口
+class SlidingWindow:
+    """
+    有状态的滑动窗口，用两个单调队列同时维护窗口最大值和最小值
+    - size：按个数的窗口，保留最近size个元素
+    - duration：按时间的窗口，保留时间戳在(t - duration, t]内的元素，时间戳需单调不减
+    时间复杂度：push O(1) 摊还
+    """
+    def __init__(self, size=None, duration=None):
+        if (size is None) == (duration is None):
+            raise ValueError("exactly one of size and duration must be given")
+        if (size if size is not None else duration) <= 0:
+            raise ValueError("window size and duration must be positive")
+        self.size = size
+        self.duration = duration
+        self.count = 0          # 已推入的元素个数，按个数的窗口用作位置
+        self.max_dq = deque()   # (位置或时间戳, 值)，值单调递减
+        self.min_dq = deque()   # (位置或时间戳, 值)，值单调递增
+    
+    @property
+    def full(self):
+        """按个数的窗口是否已经形成；按时间的窗口总是True"""
+        return self.size is None or self.count >= self.size
+    
+    @property
+    def max(self):
+        """返回当前窗口的最大值"""
+        if not self.max_dq:
+            raise IndexError("window is empty")
+        return self.max_dq[0][1]
+    
+    @property
+    def min(self):
+        """返回当前窗口的最小值"""
+        if not self.min_dq:
+            raise IndexError("window is empty")
+        return self.min_dq[0][1]
+    
+    def push(self, x, timestamp=None):
+        """
+        推入一个元素，返回当前窗口的(最大值, 最小值)
+        按时间的窗口必须提供timestamp
+        """
+        if self.duration is not None:
+            if timestamp is None:
+                raise ValueError("timestamp is required for a time-based window")
+            pos, expired = timestamp, timestamp - self.duration
+        else:
+            pos, expired = self.count, self.count - self.size
+        self.count += 1
+        
+        # 维护单调递减队列和单调递增队列
+        while self.max_dq and self.max_dq[-1][1] < x:
+            self.max_dq.pop()
+        self.max_dq.append((pos, x))
+        while self.min_dq and self.min_dq[-1][1] > x:
+            self.min_dq.pop()
+        self.min_dq.append((pos, x))
+        
+        # 移除超出窗口的元素
+        while self.max_dq[0][0] <= expired:
+            self.max_dq.popleft()
+        while self.min_dq[0][0] <= expired:
+            self.min_dq.popleft()
+        
+        return self.max_dq[0][1], self.min_dq[0][1]
+
+class SlidingAggregate:
+    """
+    任意结合律运算（sum、min、max、gcd等）的滑动窗口聚合，双栈法
+    - 后栈：新元素入栈，同时维护整个后栈的聚合值
+    - 前栈：最旧的元素在栈顶，每个位置保存它与其后（更新）所有前栈元素的聚合值
+    前栈为空时把后栈整体倒入前栈；窗口聚合 = op(前栈顶的聚合值, 后栈聚合值)
+    只要求op满足结合律，不要求交换律
+    时间复杂度：push/evict/query O(1) 摊还
+    """
+    def __init__(self, op, size=None, duration=None):
+        if (size is None) == (duration is None):
+            raise ValueError("exactly one of size and duration must be given")
+        if (size if size is not None else duration) <= 0:
+            raise ValueError("window size and duration must be positive")
+        self.op = op
+        self.size = size
+        self.duration = duration
+        self.front = []         # (时间戳, 值, 聚合值)
+        self.back = []          # (时间戳, 值)
+        self.back_agg = None
+    
+    def __len__(self):
+        """返回窗口中的元素个数"""
+        return len(self.front) + len(self.back)
+    
+    def _flip(self):
+        """把后栈倒入前栈，从最新元素开始向前累积聚合值"""
+        agg = None
+        for ts, x in reversed(self.back):
+            agg = x if agg is None else self.op(x, agg)
+            self.front.append((ts, x, agg))
+        self.back.clear()
+        self.back_agg = None
+    
+    def _oldest_timestamp(self):
+        """返回窗口中最旧元素的时间戳，前栈为空时先倒栈"""
+        if not self.front:
+            self._flip()
+        return self.front[-1][0]
+    
+    def evict(self):
+        """移除最旧的元素，返回其值"""
+        if not self.front:
+            if not self.back:
+                raise IndexError("evict from empty window")
+            self._flip()
+        return self.front.pop()[1]
+    
+    def query(self):
+        """返回当前窗口的聚合值"""
+        if self.front and self.back:
+            return self.op(self.front[-1][2], self.back_agg)
+        if self.front:
+            return self.front[-1][2]
+        if self.back:
+            return self.back_agg
+        raise IndexError("window is empty")
+    
+    def push(self, x, timestamp=None):
+        """推入一个元素并按窗口大小或时间淘汰旧元素，返回当前聚合值"""
+        if self.duration is not None and timestamp is None:
+            raise ValueError("timestamp is required for a time-based window")
+        
+        self.back.append((timestamp, x))
+        self.back_agg = x if self.back_agg is None else self.op(self.back_agg, x)
+        
+        if self.size is not None:
+            while len(self) > self.size:
+                self.evict()
+        else:
+            while self._oldest_timestamp() <= timestamp - self.duration:
+                self.evict()
+        
+        return self.query()
+    
+    @classmethod
+    def stream(cls, iterable, op, size):
+        """对任意迭代器按个数窗口产出聚合值，窗口形成后每来一个元素产出一次"""
+        window = cls(op, size=size)
+        for i, x in enumerate(iterable):
+            agg = window.push(x)
+            if i >= size - 1:
+                yield agg
+
+# 区间最值索引
+class SparseTable:
+    """
+    静态数组的区间最值索引（ST表），与MonotonicQueue按固定窗口k扫描一遍不同，
+    预处理后可以反复回答任意区间[i, j]的查询
+    第k层第i个位置保存data[i : i + 2**k]的最值，区间[i, j]由两个可能重叠的2**k块覆盖
+    所有层首尾相接存放在一个扁平数组中，offsets[k]为第k层的起点
+    - typecode=None：底层为list，可存放任意可比较对象
+    - typecode='d'/'q'/'i'等：底层为array模块的紧凑数组，支持缓冲区协议
+    时间复杂度：构建O(n log n)，查询O(1)
+    空间复杂度：O(n log n)
+    """
+    def __init__(self, data, kind='min', typecode=None):
+        if kind not in ('min', 'max'):
+            raise ValueError("kind must be 'min' or 'max'")
+        self.kind = kind
+        self.op = min if kind == 'min' else max
+        self.typecode = typecode
+        self.n = len(data)
+        
+        # 每层直接追加到扁平数组末尾，上一层通过切片读取，不保留中间列表
+        table = list(data) if typecode is None else array(typecode, data)
+        self.offsets = [0]
+        step = 1
+        while 2 * step <= self.n:
+            prev = self.offsets[-1]
+            level = table[prev:]
+            self.offsets.append(len(table))
+            # 相邻两块合并；推导式中的比较比逐对调用内置min/max快约4倍
+            if self.kind == 'min':
+                table.extend([x if x <= y else y for x, y in zip(level[:-step], level[step:])])
+            else:
+                table.extend([x if x >= y else y for x, y in zip(level[:-step], level[step:])])
+            step *= 2
+        self.table = table
+    
+    def __len__(self):
+        """返回原数组长度"""
+        return self.n
+    
+    def _check(self, i, j):
+        """检查闭区间[i, j]是否合法"""
+        if not 0 <= i <= j < self.n:
+            raise IndexError("invalid range [%d, %d]" % (i, j))
+    
+    def query(self, i, j):
+        """返回data[i..j]（闭区间）的最值"""
+        self._check(i, j)
+        k = (j - i + 1).bit_length() - 1
+        offset = self.offsets[k]
+        return self.op(self.table[offset + i], self.table[offset + j - (1 << k) + 1])
+    
+    def query_many(self, ranges):
+        """
+        批量查询，ranges为(i, j)对的可迭代对象，返回结果列表
+        ranges为形如(m, 2)的numpy数组且底层为typed array时，直接在表的缓冲区上向量化查询；
+        底层为list时先转为Python整数再逐个查询
+        无论走哪条路径都返回Python列表，与SegmentTree.query_many一致
+        """
+        if hasattr(ranges, 'shape'):
+            if self.typecode is not None:
+                return self._query_many_numpy(ranges).tolist()
+            ranges = ranges.tolist() # numpy整数没有bit_length
+        
+        table, offsets, op = self.table, self.offsets, self.op
+        result = []
+        for i, j in ranges:
+            self._check(i, j)
+            k = (j - i + 1).bit_length() - 1
+            offset = offsets[k]
+            result.append(op(table[offset + i], table[offset + j - (1 << k) + 1]))
+        return result
+    
+    def _query_many_numpy(self, ranges):
+        """numpy版本的批量查询，表通过缓冲区协议零拷贝共享，返回numpy数组"""
+        import numpy as np
+        
+        ranges = np.asarray(ranges, dtype=np.intp)
+        if ranges.ndim != 2 or ranges.shape[1] != 2:
+            raise ValueError("expected an array of shape (m, 2)")
+        i, j = ranges[:, 0], ranges[:, 1]
+        if ranges.size and not ((0 <= i) & (i <= j) & (j < self.n)).all():
+            raise IndexError("invalid range in ranges")
+        
+        table = np.frombuffer(self.table, dtype=self.table.typecode)
+        offsets = np.asarray(self.offsets, dtype=np.intp)
+        # floor(log2(长度))：frexp返回的指数比它大1
+        k = np.frexp((j - i + 1).astype(np.float64))[1] - 1
+        left = table[offsets[k] + i]
+        right = table[offsets[k] + j - (1 << k) + 1]
+        return np.minimum(left, right) if self.kind == 'min' else np.maximum(left, right)
+
+class SegmentTree:
+    """
+    支持单点修改的区间最值索引，自底向上的非递归线段树
+    叶子存放在tree[n:2n]，内部结点tree[p] = op(tree[2p], tree[2p+1])，不要求n为2的幂
+    typecode的含义与SparseTable相同
+    时间复杂度：构建O(n)，查询/修改O(log n)
+    空间复杂度：O(n)
+    """
+    def __init__(self, data, kind='min', typecode=None):
+        if kind not in ('min', 'max'):
+            raise ValueError("kind must be 'min' or 'max'")
+        self.kind = kind
+        self.op = min if kind == 'min' else max
+        self.typecode = typecode
+        self.n = n = len(data)
+        
+        tree = [None] * n + list(data) if typecode is None else array(typecode, bytes(array(typecode).itemsize * n)) + array(typecode, data)
+        op = self.op
+        for p in range(n - 1, 0, -1):
+            tree[p] = op(tree[2 * p], tree[2 * p + 1])
+        self.tree = tree
+    
+    def __len__(self):
+        """返回原数组长度"""
+        return self.n
+    
+    def __getitem__(self, index):
+        """返回data[index]的当前值"""
+        if not 0 <= index < self.n:
+            raise IndexError("index out of range")
+        return self.tree[self.n + index]
+    
+    def update(self, index, value):
+        """把data[index]改为value，沿路径向上更新祖先结点"""
+        if not 0 <= index < self.n:
+            raise IndexError("index out of range")
+        tree, op = self.tree, self.op
+        p = self.n + index
+        tree[p] = value
+        p >>= 1
+        while p:
+            new = op(tree[2 * p], tree[2 * p + 1])
+            if tree[p] == new:
+                break # 祖先的值不再变化，提前结束
+            tree[p] = new
+            p >>= 1
+    
+    def update_many(self, items):
+        """批量单点修改，items为(index, value)对的可迭代对象"""
+        for index, value in items:
+            self.update(index, value)
+    
+    def query(self, i, j):
+        """返回data[i..j]（闭区间）的最值"""
+        if not 0 <= i <= j < self.n:
+            raise IndexError("invalid range [%d, %d]" % (i, j))
+        tree, op = self.tree, self.op
+        res = None
+        l, r = i + self.n, j + self.n + 1
+        while l < r:
+            if l & 1:
+                res = tree[l] if res is None else op(res, tree[l])
+                l += 1
+            if r & 1:
+                r -= 1
+                res = tree[r] if res is None else op(res, tree[r])
+            l >>= 1
+            r >>= 1
+        return res
+    
+    def query_many(self, ranges):
+        """批量查询，ranges为(i, j)对的可迭代对象或形如(m, 2)的numpy数组，返回结果列表"""
+        if hasattr(ranges, 'shape'):
+            ranges = ranges.tolist()
+        query = self.query
+        return [query(i, j) for i, j in ranges]
@@ -0,0 +1,34 @@
+"""基准脚本共用的工具：按路径加载源文件、计时、命令行入口"""
+import argparse
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from source_loader import load
+
+
+def timed(func, *args):
+    """调用一次func，返回(耗时秒数, 返回值)"""
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main(benchmarks, description):
+    """
+    命令行入口：不带参数时运行全部基准，也可以指定名字；
+    --quick把规模缩小到约1/10，用于快速确认脚本可用，数字不可与提交说明直接比较
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("names", nargs="*", help="要运行的基准，默认全部：" + ", ".join(benchmarks))
+    parser.add_argument("--quick", action="store_true", help="缩小规模")
+    args = parser.parse_args()
+    unknown = [name for name in args.names if name not in benchmarks]
+    if unknown:
+        parser.error("unknown benchmark: " + ", ".join(unknown))
+    for name in args.names or benchmarks:
+        print(f"== {name}")
+        benchmarks[name](args.quick)
+        print()
@@ -0,0 +1,108 @@
+"""
+1.1、数组与字符串.py的基准，每个函数复现一项改动提交说明里的数字
+用法：python benchmarks/bench_arrays_strings.py [名字 ...] [--quick]
+"""
+import random
+import tracemalloc
+
+from _common import load, main, timed
+
+m = load("arrays_strings", "1.1、数组与字符串.py")
+
+
+def bench_storage(quick):
+    """DynamicArray各存储模式每个元素的内存占用（tracemalloc）"""
+    n = 10 ** 5 if quick else 10 ** 6
+    cases = [("list float", None, lambda i: i + 0.5), ("list int", None, lambda i: i + 10 ** 6),
+             ("typecode d", "d", lambda i: i + 0.5), ("typecode q", "q", lambda i: i), ("typecode i", "i", lambda i: i)]
+    for label, typecode, make in cases:
+        tracemalloc.start()
+        arr = m.DynamicArray(n, typecode)
+        arr.extend(make(i) for i in range(n))
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"  {label:12s} {used / n:6.1f} B/elem")
+        del arr
+
+
+def _edit_trace(rng, size, edits, local):
+    """(是否插入, 位置)序列：local时位置在光标附近小幅移动，否则均匀随机"""
+    cursor, trace = size // 2, []
+    for _ in range(edits):
+        if local:
+            cursor = min(max(cursor + rng.randint(-3, 3), 0), size - 1)
+        else:
+            cursor = rng.randrange(size)
+        insert = rng.random() < 0.6
+        trace.append((insert, cursor))
+        size += 1 if insert else -1
+    return trace
+
+
+def bench_gap_buffer(quick):
+    """光标附近编辑与随机编辑：DynamicArray与GapBuffer（60%插入/40%删除）"""
+    size, edits = (20_000, 2_000) if quick else (200_000, 20_000)
+    rng = random.Random(0)
+    for local in (True, False):
+        trace = _edit_trace(rng, size, edits, local)
+        for cls in (m.DynamicArray, m.GapBuffer):
+            arr = cls()
+            arr.extend(range(size))
+
+            def run():
+                for insert, pos in trace:
+                    if insert:
+                        arr.insert(pos, -1)
+                    else:
+                        arr.remove(pos)
+
+            seconds, _ = timed(run)
+            print(f"  {cls.__name__:12s} {'cursor-local' if local else 'random':12s} {seconds:7.2f} s")
+
+
+def bench_palindrome(quick):
+    """大块bytes回文的分块检查吞吐"""
+    size = (20 if quick else 200) * 2 ** 20
+    half = bytes(random.Random(1).choice(b"abc, D") for _ in range(2 ** 16)) * (size // 2 ** 17)
+    data = half + half[::-1]
+    seconds, ok = timed(m.StringAlgorithms.is_palindrome_chunked, data)
+    print(f"  {len(data) / 2 ** 20:.0f} MB bytes: {seconds:.2f} s, result {ok}")
+
+
+def bench_lcp(quick):
+    """路由键的最长公共前缀：纵向扫描、二分、min/max"""
+    n = 10 ** 5 if quick else 10 ** 6
+    rng = random.Random(2)
+    keys = ["10.20.%d.%d/%d" % (rng.randrange(256), rng.randrange(256), rng.choice([24, 32])) for _ in range(n)]
+    sa = m.StringAlgorithms
+    for label, func in (("vertical", sa.longest_common_prefix), ("binary", sa.longest_common_prefix_binary),
+                        ("min/max", sa.longest_common_prefix_minmax)):
+        seconds, prefix = timed(func, keys)
+        print(f"  {label:9s} {seconds:6.3f} s  prefix {prefix!r}")
+
+
+def bench_anagrams(quick):
+    """字母异位词分组的吞吐：排序签名、计数签名流式版本、多进程分片版本"""
+    rng = random.Random(3)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    short_n, long_n = (10 ** 5, 5 * 10 ** 3) if quick else (10 ** 6, 5 * 10 ** 4)
+    short = ["".join(rng.choice(letters) for _ in range(rng.randint(3, 12))) for _ in range(short_n)]
+    long = ["".join(rng.choice(letters) for _ in range(256)) for _ in range(long_n)]
+    sa = m.StringAlgorithms
+    for label, words in (("3-12 chars", short), ("256 chars", long)):
+        for name, func in (("sorted", sa.group_anagrams), ("stream", lambda w: list(sa.group_anagrams_stream(w))),
+                           ("parallel", sa.group_anagrams_parallel)):
+            if name == "parallel" and words is long:
+                continue
+            seconds, _ = timed(func, words)
+            print(f"  {label:10s} {name:8s} {len(words) / seconds / 1e6:6.3f} M/s")
+
+
+if __name__ == "__main__":
+    main({
+        "storage": bench_storage,
+        "gap_buffer": bench_gap_buffer,
+        "palindrome": bench_palindrome,
+        "lcp": bench_lcp,
+        "anagrams": bench_anagrams,
+    }, __doc__)
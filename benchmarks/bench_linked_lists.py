@@ -0,0 +1,118 @@
+"""
+1.2、链表.py的基准，每个函数复现一项改动提交说明里的数字
+用法：python benchmarks/bench_linked_lists.py [名字 ...] [--quick]
+"""
+import random
+import tracemalloc
+
+from _common import load, main, timed
+
+m = load("linked_lists", "1.2、链表.py")
+
+
+def bench_nodes(quick):
+    """每个节点的内存，以及add_first/remove_first循环的吞吐"""
+    n, cycles = (10 ** 4, 10 ** 5) if quick else (10 ** 5, 10 ** 6)
+    cases = [("LinkedList", lambda: m.LinkedList()), ("LinkedList + NodePool", lambda: m.LinkedList(pool=m.NodePool())),
+             ("IndexLinkedList", lambda: m.IndexLinkedList())]
+    for label, make in cases:
+        tracemalloc.start()
+        lst = make()
+        lst.extend([None] * n)
+        per_node = tracemalloc.get_traced_memory()[0] / n
+        tracemalloc.stop()
+
+        def churn():
+            for _ in range(cycles):
+                lst.add_first(None)
+                lst.remove_first()
+
+        seconds, _ = timed(churn)
+        extra = f", {lst.pool.allocated} allocs" if getattr(lst, "pool", None) else ""
+        print(f"  {label:22s} {per_node:5.1f} B/node  {2 * cycles / seconds / 1e6:5.2f} M ops/s{extra}")
+
+
+def bench_reverse(quick):
+    """迭代反转、分块递归反转、按组反转"""
+    sizes = (10 ** 3, 10 ** 5) if quick else (10 ** 3, 10 ** 5, 10 ** 6)
+    print(f"  {'n':>8s} {'iterative':>10s} {'chunked':>10s} {'k_group64':>10s}")
+    for n in sizes:
+        row = []
+        for method, args in (("reverse", ()), ("reverse_recurisve", ()), ("reverse_k_group", (64,))):
+            lst = m.LinkedList()
+            lst.extend(range(n))
+            seconds, _ = timed(getattr(lst, method), *args)
+            row.append(seconds)
+        print(f"  {n:8d} " + " ".join(f"{s:10.4f}" for s in row))
+
+
+def bench_merge_sort(quick):
+    """k个有序链表的多路归并，以及对逆序结果的归并排序"""
+    k, length = (100, 1000) if quick else (300, 3000)
+    rng = random.Random(0)
+    lists = []
+    for _ in range(k):
+        lst = m.LinkedList()
+        lst.extend(sorted(rng.random() for _ in range(length)))
+        lists.append(lst)
+    seconds, merged = timed(m.LinkedList.merge_k_sorted, lists)
+    print(f"  merge_k_sorted {k} x {length}: {seconds:.2f} s")
+    merged.reverse()
+    seconds, _ = timed(merged.sort)
+    print(f"  sort {len(merged)} reversed nodes: {seconds:.2f} s")
+
+
+def bench_indexed(quick):
+    """默认块大小下分块索引链表的随机读取、插入、删除，每次操作的平均耗时随n的变化"""
+    sizes = (10 ** 4, 10 ** 5) if quick else (10 ** 4, 10 ** 5, 10 ** 6)
+    rng = random.Random(1)
+    for n in sizes:
+        lst = m.IndexedLinkedList()
+        for i in range(n):
+            lst.add_last(i)
+        positions = [rng.randrange(n) for _ in range(2000)]
+        row = []
+        for method, args in (("get", ()), ("add_at_index", (0,)), ("remove_at_index", ())):
+            func = getattr(lst, method)
+            seconds, _ = timed(lambda: [func(i, *args) for i in positions] and None)
+            row.append(seconds / len(positions) * 1e6)
+        print(f"  n = {n:8d}  block_size {lst.block_size:4d}  get {row[0]:5.1f} us  "
+              f"add_at_index {row[1]:5.1f} us  remove_at_index {row[2]:5.1f} us")
+
+
+def bench_unrolled(quick):
+    """LinkedList与UnrolledLinkedList(64)：尾部追加、遍历、找中点、随机插入"""
+    n, inserts = (10 ** 5, 50) if quick else (10 ** 6, 200)
+    rng = random.Random(2)
+    for cls in (m.LinkedList, m.UnrolledLinkedList):
+        lst = cls()
+
+        def fill():
+            for i in range(n):
+                lst.add_last(i)
+
+        fill_s, _ = timed(fill)
+        scan_s, _ = timed(sum, lst)
+        middle_s, _ = timed(lst.find_middle)
+
+        def insert():
+            for _ in range(inserts):
+                lst.add_at_index(rng.randint(0, n), -1)
+
+        insert_s, _ = timed(insert)
+        line = (f"  {cls.__name__:20s} add_last {n / fill_s / 1e6:5.2f} M/s  scan {n / scan_s / 1e6:5.2f} M/s  "
+                f"find_middle {middle_s:.4f} s  {inserts} inserts {insert_s:.2f} s")
+        if cls is m.UnrolledLinkedList:
+            chunk_s, _ = timed(lambda: sum(sum(chunk) for chunk in lst.iter_chunks()))
+            line += f"  iter_chunks {n / chunk_s / 1e6:.0f} M/s"
+        print(line)
+
+
+if __name__ == "__main__":
+    main({
+        "nodes": bench_nodes,
+        "reverse": bench_reverse,
+        "merge_sort": bench_merge_sort,
+        "indexed": bench_indexed,
+        "unrolled": bench_unrolled,
+    }, __doc__)
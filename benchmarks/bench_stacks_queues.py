@@ -0,0 +1,287 @@
+"""
+1.3、栈与队列.py的基准，每个函数复现一项改动提交说明里的数字
+用法：python benchmarks/bench_stacks_queues.py [名字 ...] [--quick]
+"""
+import asyncio
+import multiprocessing
+import queue
+import random
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+from _common import load, main, timed
+
+m = load("stacks_queues", "1.3、栈与队列.py")
+
+
+def bench_min_stacks(quick):
+    """MinStack与压缩辅助栈的内存和push/pop耗时（随机浮点数）"""
+    n = 2 * 10 ** 5 if quick else 2 * 10 ** 6
+    data = [random.random() for _ in range(n)]
+    for cls in (m.MinStack, m.CompressedMinStack, m.MinMaxStack):
+        tracemalloc.start()
+        stack = cls()
+        push_s, _ = timed(lambda: [stack.push(v) for v in data] and None)
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        def pop_all():
+            for _ in range(n):
+                stack.pop()
+
+        pop_s, _ = timed(pop_all)
+        print(f"  {cls.__name__:20s} {used / 1e6:6.1f} MB  push {push_s:.2f} s  pop {pop_s:.2f} s")
+
+
+def bench_array_queue(quick):
+    """1024槽位队列上的单个与批量(1000)入队出队吞吐"""
+    n = 10 ** 5 if quick else 10 ** 6
+    for cls in (m.ArrayQueue, m.PowerOfTwoArrayQueue):
+        q = cls(1024)
+
+        def single():
+            for i in range(n):
+                q.enqueue(i)
+                q.dequeue()
+
+        def batch():
+            block = list(range(1000))
+            for _ in range(n // 1000):
+                q.extend(block)
+                q.dequeue_many(1000)
+
+        single_s, _ = timed(single)
+        batch_s, _ = timed(batch)
+        print(f"  {cls.__name__:22s} single {2 * n / single_s / 1e6:5.2f} M ops/s  batch(1000) {2 * n / batch_s / 1e6:5.1f} M ops/s")
+
+
+def bench_ring_deque(quick):
+    """中间位置的按下标访问：RingDeque与collections.deque"""
+    lookups = 10 ** 4 if quick else 10 ** 5
+    for n in (10 ** 4, 10 ** 6):
+        ring, dq = m.RingDeque(range(n)), deque(range(n))
+        positions = [n // 2 + random.randint(-100, 100) for _ in range(lookups)]
+        ring_s, _ = timed(lambda: [ring[i] for i in positions] and None)
+        deque_s, _ = timed(lambda: [dq[i] for i in positions] and None)
+        print(f"  n = {n:8d}  RingDeque {ring_s:.3f} s  collections.deque {deque_s:.3f} s")
+
+
+def _thread_throughput(make, producers, batch, n):
+    """多生产者单消费者线程间传递n个元素，返回M items/s"""
+    q, per = make(), n // producers
+
+    def produce():
+        if batch:
+            for i in range(0, per, batch):
+                q.put_many(list(range(i, min(i + batch, per))))
+        else:
+            for i in range(per):
+                q.put(i)
+
+    def consume():
+        got = 0
+        while got < per * producers:
+            if batch:
+                got += len(q.get_many(batch))
+            else:
+                q.get()
+                got += 1
+
+    threads = [threading.Thread(target=produce) for _ in range(producers)] + [threading.Thread(target=consume)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return per * producers / (time.perf_counter() - start) / 1e6
+
+
+async def _async_throughput(make, producers, batch, n):
+    """多生产者单消费者协程间传递n个元素，返回M items/s"""
+    q, per = make(), n // producers
+
+    async def produce():
+        if batch:
+            for i in range(0, per, batch):
+                await q.put_many(list(range(i, min(i + batch, per))))
+        else:
+            for i in range(per):
+                await q.put(i)
+
+    async def consume():
+        got = 0
+        while got < per * producers:
+            if batch:
+                got += len(await q.get_many(batch))
+            else:
+                await q.get()
+                got += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(consume(), *[produce() for _ in range(producers)])
+    return per * producers / (time.perf_counter() - start) / 1e6
+
+
+def bench_concurrent_queues(quick):
+    """1024槽位有界队列，1个消费者，1/4个生产者（M items/s）"""
+    n = 2 * 10 ** 4 if quick else 2 * 10 ** 5
+    cases = [("queue.Queue", lambda: queue.Queue(1024), 0), ("Concurrent", lambda: m.ConcurrentArrayQueue(1024), 0),
+             ("Concurrent batch256", lambda: m.ConcurrentArrayQueue(1024), 256)]
+    async_cases = [("asyncio.Queue", lambda: asyncio.Queue(1024), 0), ("Async", lambda: m.AsyncArrayQueue(1024), 0),
+                   ("Async batch256", lambda: m.AsyncArrayQueue(1024), 256)]
+    print(f"  {'':22s} {'1 producer':>11s} {'4 producers':>12s}")
+    for label, make, batch in cases:
+        rates = [_thread_throughput(make, p, batch, n) for p in (1, 4)]
+        print(f"  {label:22s} {rates[0]:11.2f} {rates[1]:12.2f}")
+    for label, make, batch in async_cases:
+        rates = [asyncio.run(_async_throughput(make, p, batch, n)) for p in (1, 4)]
+        print(f"  {label:22s} {rates[0]:11.2f} {rates[1]:12.2f}")
+
+
+def _ring_producer(name, n, size):
+    """spawn出的生产者进程：写入n条记录后写一条空记录作为结束标记"""
+    ring = load("stacks_queues", "1.3、栈与队列.py").SharedRingBuffer(name=name, create=False)
+    payload = bytes(range(256)) * (size // 256 + 1)
+    for i in range(n):
+        ring.put(payload[i % 7:i % 7 + size - i % 5])
+    ring.put(b"")
+    ring.close()
+
+
+def bench_shared_ring(quick):
+    """spawn出的生产者进程到本进程消费者，peek/release零拷贝读取，1 MiB环形缓冲区"""
+    for size in (64, 1024, 16384):
+        n = (20_000 if size < 10_000 else 4_000) if quick else (200_000 if size < 10_000 else 40_000)
+        ring = m.SharedRingBuffer(1 << 20)
+        payload = bytes(range(256)) * (size // 256 + 1)
+        producer = multiprocessing.get_context("spawn").Process(target=_ring_producer, args=(ring.name, n, size))
+        start = time.perf_counter()
+        producer.start()
+        got = nbytes = 0
+        ok = True
+        while True:
+            view = ring.peek()
+            if view is None:
+                time.sleep(0)
+                continue
+            if len(view) == 0:
+                view.release()
+                ring.release()
+                break
+            if got % 997 == 0:
+                ok &= bytes(view) == payload[got % 7:got % 7 + size - got % 5]
+            nbytes += len(view)
+            got += 1
+            view.release()
+            ring.release()
+        seconds = time.perf_counter() - start
+        producer.join()
+        print(f"  {size:6d} B records  {got / seconds / 1e6:5.2f} M rec/s  {nbytes / seconds / 1e6:7.0f} MB/s  verified={ok and got == n}")
+        ring.close()
+        ring.unlink()
+
+
+def bench_heaps(quick):
+    """n次push后n次pop（随机浮点数），以及批量建堆"""
+    import heapq
+
+    n = 10 ** 5 if quick else 10 ** 6
+    data = [random.random() for _ in range(n)]
+
+    def run_heapq():
+        heap = []
+        for i, p in enumerate(data):
+            heapq.heappush(heap, (p, i))
+        for _ in range(n):
+            heapq.heappop(heap)
+
+    def run(make):
+        def inner():
+            heap = make()
+            for i, p in enumerate(data):
+                heap.push(p, i)
+            for _ in range(n):
+                heap.pop()
+        return inner
+
+    cases = [("heapq (tuples)", run_heapq), ("DaryHeap d=2", run(lambda: m.DaryHeap(d=2))),
+             ("DaryHeap d=2 stable=False", run(lambda: m.DaryHeap(d=2, stable=False))),
+             ("DaryHeap d=4", run(lambda: m.DaryHeap(d=4))), ("IndexedHeap d=4", run(lambda: m.IndexedHeap(d=4)))]
+    for label, func in cases:
+        seconds, _ = timed(func)
+        print(f"  {label:26s} {seconds:6.2f} s")
+    pairs = [(p, i) for i, p in enumerate(data)]
+    heapify_s, _ = timed(m.DaryHeap, pairs)
+    heapq_s, _ = timed(heapq.heapify, list(pairs))
+    print(f"  heapify {n}: DaryHeap {heapify_s:.2f} s, heapq.heapify {heapq_s:.2f} s")
+
+
+def bench_monotonic_batch(quick):
+    """单调栈批量接口与逐行循环（随机整数矩阵，需要numpy）"""
+    try:
+        import numpy as np
+    except ImportError:
+        print("  numpy is not installed, skipped")
+        return
+    rows = 200 if quick else 2000
+    matrix = np.random.default_rng(0).integers(0, 100, size=(rows, 500))
+    lists = matrix.tolist()
+    ms = m.MonotonicStack
+    for label, batch, single in (("next_greater_element", ms.next_greater_element_batch, ms.next_greater_element),
+                                 ("daily_temperatures", ms.daily_temperatures_batch, ms.daily_temperatures),
+                                 ("largest_rectangle_area", ms.largest_rectangle_area_batch, ms.largest_rectangle_area)):
+        batch_s, _ = timed(batch, matrix)
+        loop_s, _ = timed(lambda: [single(row) for row in lists])
+        print(f"  {label:24s} batch {batch_s:.2f} s  per-row loop {loop_s:.2f} s")
+
+
+def bench_maximal_rectangle(quick):
+    """随机二进制矩阵（90%为1）的最大矩形：串行、进程池，以及原有的逐行面积循环"""
+    rows = 400 if quick else 4000
+    rng = random.Random(1)
+    matrix = [[int(rng.random() < 0.9) for _ in range(1000)] for _ in range(rows)]
+    ms = m.MonotonicStack
+    serial_s, result = timed(ms.maximal_rectangle, matrix)
+    pool_s, pooled = timed(lambda: ms.maximal_rectangle(matrix, processes=4))
+    area_s, _ = timed(lambda: [ms.largest_rectangle_area(row) for row in matrix])
+    print(f"  serial {serial_s:.2f} s  processes=4 {pool_s:.2f} s  largest_rectangle_area loop {area_s:.2f} s  "
+          f"{result} same={result == pooled}")
+
+
+def bench_range_index(quick):
+    """n个浮点数上的随机区间（长度至多5万）最大值查询"""
+    n, q = (10 ** 5, 2 * 10 ** 4) if quick else (10 ** 6, 2 * 10 ** 5)
+    rng = random.Random(2)
+    data = [rng.random() for _ in range(n)]
+    ranges = [(i, min(n - 1, i + rng.randint(0, 50_000))) for i in (rng.randrange(n) for _ in range(q))]
+    build_s, table = timed(m.SparseTable, data, "max", "d")
+    query_s, expected = timed(table.query_many, ranges)
+    print(f"  SparseTable('d')  build {build_s:.2f} s, table {len(table.table) * table.table.itemsize / 1e6:.0f} MB, "
+          f"query_many {query_s:.3f} s")
+    try:
+        import numpy as np
+        numpy_s, result = timed(table.query_many, np.array(ranges))
+        print(f"                    numpy query_many {numpy_s:.3f} s, same={result == expected}")
+    except ImportError:
+        pass
+    build_s, tree = timed(m.SegmentTree, data, "max", "d")
+    query_s, result = timed(tree.query_many, ranges)
+    print(f"  SegmentTree('d')  build {build_s:.2f} s, query_many {query_s:.3f} s, same={result == expected}")
+    naive_s, _ = timed(lambda: [max(data[i:j + 1]) for i, j in ranges[:q // 100]])
+    print(f"  naive max(slice)  {naive_s:.2f} s for {q // 100} of the ranges")
+
+
+if __name__ == "__main__":
+    main({
+        "min_stacks": bench_min_stacks,
+        "array_queue": bench_array_queue,
+        "ring_deque": bench_ring_deque,
+        "concurrent_queues": bench_concurrent_queues,
+        "shared_ring": bench_shared_ring,
+        "heaps": bench_heaps,
+        "monotonic_batch": bench_monotonic_batch,
+        "maximal_rectangle": bench_maximal_rectangle,
+        "range_index": bench_range_index,
+    }, __doc__)
@@ -0,0 +1,20 @@
+"""
+按路径加载1、基础数据结构下的源文件
+文件名含有“、”，不是合法的模块名，不能直接import；tests/和benchmarks/共用这里的load
+"""
+import importlib.util
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parent / "1、基础数据结构"
+
+
+def load(name, filename):
+    """按路径加载源文件，并注册到sys.modules以便进程池pickle"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, ROOT / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,23 @@
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from source_loader import load
+
+
+@pytest.fixture(scope="session")
+def arrays():
+    return load("arrays_strings", "1.1、数组与字符串.py")
+
+
+@pytest.fixture(scope="session")
+def linked():
+    return load("linked_lists", "1.2、链表.py")
+
+
+@pytest.fixture(scope="session")
+def stacks():
+    return load("stacks_queues", "1.3、栈与队列.py")
@@ -0,0 +1,258 @@
+import gc
+import random
+import weakref
+
+import pytest
+
+
+class Payload:
+    pass
+
+
+def test_gap_buffer_move_gap_releases_vacated_slots(arrays):
+    buf = arrays.GapBuffer()
+    objs = [Payload() for _ in range(4)]
+    refs = [weakref.ref(o) for o in objs]
+    buf.extend(objs)
+    del objs
+    buf.move_gap(0)
+    for _ in range(4):
+        buf.remove(0)
+    gc.collect()
+    assert len(buf) == 0
+    assert all(r() is None for r in refs)
+
+
+@pytest.mark.parametrize("typecode", [None, "q"])
+def test_gap_buffer_matches_list(arrays, typecode):
+    rng = random.Random(1)
+    buf, ref = arrays.GapBuffer(4, typecode), []
+    for _ in range(3000):
+        op = rng.random()
+        if op < 0.4 or not ref:
+            i, v = rng.randint(0, len(ref)), rng.randint(1, 99)
+            buf.insert(i, v)
+            ref.insert(i, v)
+        elif op < 0.5:
+            i, vs = rng.randint(0, len(ref)), [rng.randint(1, 99) for _ in range(rng.randint(0, 5))]
+            buf.insert_many(i, vs)
+            ref[i:i] = vs
+        elif op < 0.9:
+            i = rng.randrange(len(ref))
+            assert buf.remove(i) == ref.pop(i)
+        else:
+            i = rng.randint(0, len(ref))
+            j = rng.randint(i, min(len(ref), i + 4))
+            buf.delete_slice(i, j)
+            del ref[i:j]
+        assert list(buf) == ref
+    # 空隙中不应残留任何元素
+    empty = None if typecode is None else 0
+    assert all(x == empty for x in buf.data[buf.gap_start:buf.gap_end])
+
+
+def test_gap_buffer_dynamic_array_interface(arrays):
+    buf = arrays.GapBuffer(4, None, arrays.GrowthPolicy(factor=1, increment=8, shrink_at=0))
+    buf.extend(range(10))
+    assert buf.capacity == 12
+    ref = list(range(10))
+    buf.move_gap(5)
+    buf[0:2] = ["a", "b", "c"]
+    ref[0:2] = ["a", "b", "c"]
+    buf[7:] = []
+    ref[7:] = []
+    buf[1:6:2] = ref[1:6:2] = ["x", "y", "z"]
+    assert list(buf) == ref
+    with pytest.raises(ValueError):
+        buf[::2] = [1]
+    assert buf[1:4].growth_policy is buf.growth_policy
+
+    big = arrays.GapBuffer()
+    big.extend(range(100000))
+    big.delete_slice(10, 100000)
+    assert list(big) == list(range(10)) and big.capacity < 100
+    big.reserve(1000)
+    assert big.capacity >= 1000 and list(big) == list(range(10))
+    big.shrink_to_fit()
+    assert big.capacity == 10 and list(big) == list(range(10))
+
+    typed = arrays.GapBuffer(typecode="d")
+    typed.extend([1.0, 2.0, 3.0])
+    typed.move_gap(1)
+    view = typed.as_memoryview()
+    assert view.tolist() == [1.0, 2.0, 3.0]
+    view[0] = 9.0
+    assert typed[0] == 9.0
+    view.release()
+    with pytest.raises(TypeError):
+        buf.as_memoryview()
+
+
+def test_gap_buffer_far_edits_match_list(arrays):
+    rng = random.Random(2)
+    buf, ref = arrays.GapBuffer(), list(range(2000))
+    buf.extend(ref)
+    for step in range(3000):
+        # 交替出现远处的随机编辑和光标附近的连续编辑，覆盖原地编辑与移动空隙两条路径
+        i = rng.randint(0, len(ref)) if step % 100 < 50 else min(len(ref), 1000 + step % 7)
+        op = rng.random()
+        if op < 0.4 or not ref:
+            buf.insert(i, step)
+            ref.insert(i, step)
+        elif op < 0.8 and i < len(ref):
+            assert buf.remove(i) == ref.pop(i)
+        else:
+            j = min(len(ref), i + rng.randint(0, 4))
+            vs = [-step] * rng.randint(0, 4)
+            buf[i:j] = vs
+            ref[i:j] = vs
+        assert len(buf) == len(ref)
+    assert list(buf) == ref
+    assert all(x is None for x in buf.data[buf.gap_start:buf.gap_end])
+
+
+def test_group_anagrams_parallel_matches_serial(arrays):
+    rng = random.Random(3)
+    words = ["".join(rng.choice("abcde") for _ in range(rng.randint(0, 6))) for _ in range(3000)]
+    words += ["z" * 70, "é" * 3]
+
+    def normalize(groups):
+        return sorted(sorted(g) for g in groups)
+
+    expected = normalize(arrays.StringAlgorithms.group_anagrams(words))
+    assert normalize(arrays.StringAlgorithms.group_anagrams_parallel(words, processes=2)) == expected
+
+
+def _check_dynamic_array(arr, rng, steps=2000):
+    """对arr和参照list做相同的随机单个与批量编辑，每步检查长度与容量"""
+    ref = list(arr)
+    for _ in range(steps):
+        op = rng.random()
+        if op < 0.3 or not ref:
+            v = rng.randint(-99, 99)
+            arr.append(v)
+            ref.append(v)
+        elif op < 0.5:
+            i, v = rng.randint(0, len(ref)), rng.randint(-99, 99)
+            arr.insert(i, v)
+            ref.insert(i, v)
+        elif op < 0.6:
+            i, vs = rng.randint(0, len(ref)), [rng.randint(-99, 99) for _ in range(rng.randint(0, 6))]
+            arr.insert_many(i, vs)
+            ref[i:i] = vs
+        elif op < 0.85:
+            i = rng.randrange(len(ref))
+            assert arr.remove(i) == ref.pop(i)
+        else:
+            i = rng.randint(0, len(ref))
+            j = rng.randint(i, min(len(ref), i + 5))
+            arr.delete_slice(i, j)
+            del ref[i:j]
+        assert len(arr) == len(ref) <= arr.capacity
+    assert list(arr) == ref
+    assert list(arr[1:-1:2]) == ref[1:-1:2]
+    return ref
+
+
+@pytest.mark.parametrize("typecode", [None, "q"])
+def test_dynamic_array_matches_list(arrays, typecode):
+    _check_dynamic_array(arrays.DynamicArray(2, typecode), random.Random(5))
+
+
+@pytest.mark.parametrize("typecode", [None, "q"])
+@pytest.mark.parametrize("factor, increment, shrink_at", [(1.5, 0, 0.2), (1, 8, 0.25)])
+def test_dynamic_array_growth_policies(arrays, typecode, factor, increment, shrink_at):
+    arr = arrays.DynamicArray(2, typecode, arrays.GrowthPolicy(factor, increment, shrink_at))
+    ref = _check_dynamic_array(arr, random.Random(5))
+    arr.shrink_to_fit()
+    assert list(arr) == ref and arr.capacity == max(len(ref), 1)
+    arr.reserve(len(ref) + 100)
+    assert list(arr) == ref and arr.capacity >= len(ref) + 100
+
+
+@pytest.mark.parametrize("kwargs", [{"shrink_at": -0.1}, {"shrink_at": 0.5}, {"factor": 1.5, "shrink_at": 0.7},
+                                    {"factor": 1, "increment": 8, "shrink_at": 1}])
+def test_growth_policy_rejects_shrink_at_without_hysteresis(arrays, kwargs):
+    with pytest.raises(ValueError):
+        arrays.GrowthPolicy(**kwargs)
+
+
+def test_dynamic_array_typed_memoryview(arrays):
+    arr = arrays.DynamicArray(typecode="d")
+    arr.extend([1.5, 2.5, 3.5])
+    view = arr.as_memoryview()
+    assert view.tolist() == [1.5, 2.5, 3.5]
+    view[0] = 9.0
+    assert arr[0] == 9.0
+
+
+def _naive_find_all(text, pattern):
+    return [i for i in range(len(text) - len(pattern) + 1) if text[i:i + len(pattern)] == pattern]
+
+
+def test_substring_search_matches_naive(arrays):
+    sa = arrays.StringAlgorithms
+    rng = random.Random(6)
+    for _ in range(300):
+        text = "".join(rng.choice("ab") for _ in range(rng.randint(0, 60)))
+        patterns = list({"".join(rng.choice("ab") for _ in range(rng.randint(1, 5))) for _ in range(4)})
+        for p in patterns:
+            expected = _naive_find_all(text, p)
+            assert list(sa.kmp_search(text, p)) == expected
+            assert list(sa.horspool_search(text, p)) == expected
+            assert list(sa.kmp_search(memoryview(text.encode()), p.encode())) == expected
+        expected = sorted((i, p) for p in patterns for i in _naive_find_all(text, p))
+        assert sorted(sa.multi_pattern_search(text, patterns)) == expected
+        assert sorted(arrays.AhoCorasick(patterns).search(text)) == expected
+
+
+def test_palindrome_variants_agree(arrays, tmp_path):
+    sa = arrays.StringAlgorithms
+    rng = random.Random(7)
+    for _ in range(300):
+        half = "".join(rng.choice("aB1 ,.") for _ in range(rng.randint(0, 20)))
+        s = half + rng.choice(["", "x"]) + half[::-1] if rng.random() < 0.5 else half
+        expected = sa.is_palindrome(s)
+        assert sa.is_palindrome_inplace(s) == expected
+        assert sa.is_palindrome_inplace(s.encode()) == expected
+        assert sa.is_palindrome_chunked(s, chunk_size=3) == expected
+        assert sa.is_palindrome_chunked(s.encode(), chunk_size=4) == expected
+        path = tmp_path / "p.txt"
+        path.write_bytes(s.encode())
+        with open(path, "rb") as f:
+            assert sa.is_palindrome_chunked(f, chunk_size=5) == expected
+        assert "".join(sa.reverse_chunks(s, chunk_size=3)) == s[::-1]
+
+
+def test_longest_common_prefix_variants_agree(arrays):
+    sa = arrays.StringAlgorithms
+    rng = random.Random(8)
+    for _ in range(300):
+        strs = ["10.0." + "".join(rng.choice("01.") for _ in range(rng.randint(0, 6))) for _ in range(rng.randint(1, 12))]
+        expected = sa.longest_common_prefix(strs)
+        assert sa.longest_common_prefix_minmax(strs) == expected
+        assert sa.longest_common_prefix_binary(strs) == expected
+        assert sa.longest_common_prefix_auto(strs) == expected
+        assert arrays.RadixTrie(strs).longest_common_prefix() == expected
+        assert arrays.RadixTrie(strs).longest_common_prefix("10.0.") == expected
+
+
+def test_group_anagrams_stream_matches_sorted(arrays):
+    sa = arrays.StringAlgorithms
+    rng = random.Random(9)
+    words = ["".join(rng.choice("abc") for _ in range(rng.choice([2, 3, 70, 71]))) for _ in range(500)]
+    words += ["Straße", "eßtraS"]
+
+    def normalize(groups):
+        return sorted(sorted(g) for g in groups)
+
+    assert normalize(sa.group_anagrams_stream(iter(words))) == normalize(sa.group_anagrams(words))
+
+
+def test_dynamic_array_slice_keeps_storage_and_policy(arrays):
+    policy = arrays.GrowthPolicy(factor=1, increment=8, shrink_at=0)
+    arr = arrays.DynamicArray(4, "q", policy)
+    arr.extend(range(10))
+    part = arr[2:8:2]
+    assert list(part) == [2, 4, 6]
+    assert part.typecode == "q" and part.growth_policy is policy
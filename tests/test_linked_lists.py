@@ -0,0 +1,265 @@
+import random
+
+import pytest
+
+
+def test_memoize_separates_positional_and_keyword_arguments(linked):
+    @linked.memoize()
+    def f(*args, **kwargs):
+        return args, kwargs
+
+    assert f(1, 2, a=3) == ((1, 2), {"a": 3})
+    assert f((1, 2), (("a", 3),)) == (((1, 2), (("a", 3),)), {})
+    assert f(1, 2, a=3) == ((1, 2), {"a": 3})
+
+
+def test_doubly_link_list_with_pool(linked):
+    pool = linked.NodePool(linked.DoublyListNode)
+    dll = linked.DoublyLinkList(pool=pool)
+    for v in range(5):
+        dll.add_last(v)
+    dll.remove_first()
+    dll.add_last(5)
+    assert pool.reused == 1
+    with pytest.raises(TypeError):
+        linked.DoublyLinkList(pool=linked.NodePool())
+    with pytest.raises(TypeError):
+        linked.LinkedList(pool=linked.NodePool(linked.DoublyListNode))
+
+
+def test_index_linked_list_reverse_recursive(linked):
+    lst = linked.IndexLinkedList()
+    lst.extend(range(1200))
+    lst.reverse_recurisve()
+    assert list(lst) == list(range(1199, -1, -1))
+    assert len(lst) == 1200
+    lst.add_last("x")
+    assert list(lst)[-2:] == [0, "x"]
+
+
+def _random_ops(rng, lst, ref, steps, ops):
+    """对lst和参照list做相同的随机操作，每步比较内容"""
+    for _ in range(steps):
+        name = rng.choice(ops)
+        if name.startswith("remove") and not ref:
+            name = "add_last"
+        v = rng.randint(0, 99)
+        if name == "add_first":
+            lst.add_first(v)
+            ref.insert(0, v)
+        elif name == "add_last":
+            lst.add_last(v)
+            ref.append(v)
+        elif name == "add_at_index":
+            i = rng.randint(0, len(ref))
+            lst.add_at_index(i, v)
+            ref.insert(i, v)
+        elif name == "remove_first":
+            assert lst.remove_first() == ref.pop(0)
+        elif name == "remove_last":
+            assert lst.remove_last() == ref.pop()
+        elif name == "remove_at_index":
+            i = rng.randrange(len(ref))
+            assert lst.remove_at_index(i) == ref.pop(i)
+        assert list(lst) == ref and len(lst) == len(ref)
+
+
+BASIC_OPS = ["add_first", "add_last", "add_at_index", "remove_first", "remove_last"]
+
+
+def test_linked_list_matches_list(linked):
+    rng = random.Random(10)
+    lst, ref = linked.LinkedList(), []
+    _random_ops(rng, lst, ref, 1500, BASIC_OPS)
+    lst.add_last("tail")
+    assert lst.tail.val == "tail"
+
+
+def test_linked_list_with_node_pool_matches_list(linked):
+    rng = random.Random(10)
+    pool = linked.NodePool()
+    lst, ref = linked.LinkedList(pool=pool), []
+    _random_ops(rng, lst, ref, 1500, BASIC_OPS)
+    assert pool.reused > 0
+
+
+def test_index_linked_list_matches_list(linked):
+    rng = random.Random(11)
+    lst, ref = linked.IndexLinkedList(), []
+    _random_ops(rng, lst, ref, 1500, BASIC_OPS)
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 16])
+def test_indexed_linked_list_matches_list(linked, block_size):
+    rng = random.Random(12)
+    lst, ref = linked.IndexedLinkedList(block_size), []
+    _random_ops(rng, lst, ref, 1500, BASIC_OPS + ["remove_at_index"] * 2)
+    assert [lst.get(i) for i in range(len(ref))] == ref
+
+
+def test_indexed_linked_list_block_size_tracks_sqrt_size(linked):
+    n = 70000
+    lst = linked.IndexedLinkedList()
+    for i in range(n):
+        lst.add_last(i)
+    # 4 * 128² < n <= 4 * 256²，块大小翻倍两次后约为√n
+    assert lst.block_size == 256
+    assert sum(count for _, count in lst.blocks) == n
+    assert all(0 < count <= 2 * lst.block_size for _, count in lst.blocks)
+    rng = random.Random(17)
+    for i in (rng.randrange(n) for _ in range(200)):
+        assert lst.get(i) == i
+    while len(lst) > 100:
+        lst.remove_first()
+    assert lst.block_size == 64
+    assert list(lst) == list(range(n - 100, n))
+
+
+@pytest.mark.parametrize("node_capacity", [2, 5, 64])
+def test_unrolled_linked_list_matches_list(linked, node_capacity):
+    rng = random.Random(13)
+    lst, ref = linked.UnrolledLinkedList(node_capacity), []
+    _random_ops(rng, lst, ref, 1500, BASIC_OPS + ["remove_at_index"] * 2)
+    assert [lst.get(i) for i in range(len(ref))] == ref
+    assert [v for chunk in lst.iter_chunks() for v in chunk] == ref
+    if ref:
+        assert lst.find_middle() == ref[len(ref) // 2]
+
+
+def test_linked_list_reversals(linked):
+    for n in (0, 1, 2, 7, 1001, 2500):
+        for chunk_size in (1, 3, 500):
+            lst = linked.LinkedList()
+            lst.extend(range(n))
+            lst.reverse_recurisve(chunk_size)
+            assert list(lst) == list(range(n - 1, -1, -1))
+            assert lst.tail is None or lst.tail.val == 0
+        for k in (1, 2, 3, 64):
+            lst = linked.LinkedList()
+            lst.extend(range(n))
+            lst.reverse_k_group(k)
+            ref = list(range(n))
+            expected = []
+            for i in range(0, n, k):
+                block = ref[i:i + k]
+                expected += block[::-1] if len(block) == k else block
+            assert list(lst) == expected
+        lst = linked.LinkedList()
+        lst.extend(range(n))
+        assert list(reversed(lst)) == list(range(n - 1, -1, -1))
+
+
+class Item:
+    """只按key比较，tag用于检查稳定性"""
+
+    def __init__(self, key, tag):
+        self.key, self.tag = key, tag
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+    def __le__(self, other):
+        return self.key <= other.key
+
+    def __gt__(self, other):
+        return self.key > other.key
+
+    def __ge__(self, other):
+        return self.key >= other.key
+
+
+def test_merge_k_sorted_and_sort_are_stable(linked):
+    rng = random.Random(14)
+    pairs = [[(rng.randint(0, 9), (k, i)) for i in range(rng.randint(0, 30))] for k in range(8)]
+    lists = []
+    for p in pairs:
+        p.sort(key=lambda t: t[0])
+        lst = linked.LinkedList()
+        lst.extend(Item(*t) for t in p)
+        lists.append(lst)
+    expected = sorted((t for p in pairs for t in p), key=lambda t: t[0])
+    lazy = [(x.key, x.tag) for x in linked.LinkedList.iter_merge_sorted(lists)]
+    merged = linked.LinkedList.merge_k_sorted(lists)
+    assert lazy == [(x.key, x.tag) for x in merged] == expected
+    assert all(len(lst) == 0 for lst in lists)
+
+    data = [Item(rng.randint(0, 9), i) for i in range(500)]
+    lst = linked.LinkedList()
+    lst.extend(data)
+    lst.sort()
+    assert [(x.key, x.tag) for x in lst] == [(x.key, x.tag) for x in sorted(data)]
+    assert lst.tail.val is list(lst)[-1]
+
+
+def test_lru_cache_matches_ordered_dict(linked):
+    from collections import OrderedDict
+
+    rng = random.Random(15)
+    cache, ref = linked.LRUCache(capacity=8), OrderedDict()
+    for _ in range(3000):
+        key = rng.randint(0, 15)
+        if rng.random() < 0.5:
+            assert cache.get(key) == ref.get(key)
+            if key in ref:
+                ref.move_to_end(key)
+        else:
+            cache.put(key, key * 10)
+            ref[key] = key * 10
+            ref.move_to_end(key)
+            if len(ref) > 8:
+                ref.popitem(last=False)
+        assert len(cache) == len(ref)
+
+
+def test_lfu_cache_evicts_least_frequent_then_oldest(linked):
+    rng = random.Random(16)
+    cache = linked.LFUCache(capacity=5)
+    freq, last_use, values, clock = {}, {}, {}, 0
+    for _ in range(3000):
+        clock += 1
+        key = rng.randint(0, 10)
+        if rng.random() < 0.5:
+            assert cache.get(key) == values.get(key)
+            if key in values:
+                freq[key] += 1
+                last_use[key] = clock
+        else:
+            if key not in values and len(values) == 5:
+                victim = min(values, key=lambda k: (freq[k], last_use[k]))
+                del values[victim], freq[victim], last_use[victim]
+            freq[key] = freq.get(key, 0) + 1
+            last_use[key] = clock
+            values[key] = clock
+            cache.put(key, clock)
+        assert len(cache) == len(values)
+
+
+def test_cache_ttl_and_byte_budget(linked):
+    now = [0.0]
+    cache = linked.LRUCache(capacity=100, ttl=10, clock=lambda: now[0])
+    cache.put("a", 1)
+    now[0] = 5
+    cache.put("b", 2)
+    now[0] = 12
+    assert cache.get("a") is None and cache.get("b") == 2
+    now[0] = 20
+    cache.purge_expired()
+    assert len(cache) == 0
+    assert cache.stats()["expirations"] == 2
+
+    sized = linked.LFUCache(capacity=100, max_bytes=10, sizeof=len)
+    for key in "abcd":
+        sized.put(key, "xxxx")
+    assert sized.total_bytes <= 10 and len(sized) == 2
+
+
+@pytest.mark.parametrize("cls", ["LRUCache", "LFUCache"])
+def test_zero_capacity_cache_stores_nothing(linked, cls):
+    cache = getattr(linked, cls)(capacity=0)
+    cache.put(1, 1)
+    cache.put(2, 2)
+    assert len(cache) == 0 and cache.get(1) is None
+    assert cache.stats()["evictions"] == 2
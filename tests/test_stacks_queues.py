@@ -0,0 +1,456 @@
+import queue
+import random
+
+import pytest
+
+
+def test_shared_ring_buffer_records_up_to_half_capacity(stacks):
+    ring = stacks.SharedRingBuffer(capacity=64)
+    try:
+        # 记录占20~32字节（不超过容量一半），在任意偏移处反复回绕，都必须能写入
+        rng = random.Random(0)
+        for i in range(2000):
+            data = bytes([i % 256]) * rng.randint(13, 28)
+            assert ring.try_put(data)
+            assert ring.try_get() == data
+        with pytest.raises(ValueError):
+            ring.try_put(b"x" * 29)  # need = 36 > 64 // 2
+    finally:
+        ring.close()
+        ring.unlink()
+
+
+def test_array_queue_rejects_shrink_at_above_half(stacks):
+    with pytest.raises(ValueError):
+        stacks.ArrayQueue(4, shrink_at=0.75)
+
+
+def test_array_queue_shrink_keeps_contents(stacks):
+    q = stacks.ArrayQueue(4, shrink_at=0.5)
+    q.extend(range(40))
+    out = q.dequeue_many(35) + [q.dequeue() for _ in range(4)]
+    assert out == list(range(39))
+    assert list(q) == [39]
+    assert len(q.items) == q.capacity >= len(q)
+
+
+def test_array_queue_zero_capacity(stacks):
+    q = stacks.ArrayQueue(0)
+    q.extend([1, 2, 3])
+    q.enqueue(4)
+    assert list(q) == [1, 2, 3, 4]
+    q = stacks.ArrayQueue(0)
+    q.enqueue(1)
+    assert q.dequeue() == 1
+    q = stacks.ArrayQueue(0)
+    q.extend([])
+    assert len(q) == 0 and q.capacity == 0
+    q.extend([1, 2])
+    with pytest.raises(ValueError):
+        q.dequeue_many(-1)
+    assert q.dequeue_many(0) == [] and list(q) == [1, 2]
+
+
+def test_ring_deque_enqueue_respects_maxlen(stacks):
+    d = stacks.RingDeque(maxlen=2)
+    d.push_back(1)
+    d.push_back(2)
+    d.enqueue(3)
+    assert list(d) == [2, 3]
+    assert d.capacity == 2
+    d.extend([4, 5, 6])
+    d.push_front(0)
+    assert list(d) == [0, 5]
+
+
+@pytest.mark.parametrize("typecode", [None, "q"])
+def test_range_indexes_accept_numpy_ranges(stacks, typecode):
+    np = pytest.importorskip("numpy")
+    data = [5, 1, 4, 2, 8, 7, 3]
+    ranges = np.array([(0, 6), (2, 3), (4, 4), (1, 5)])
+    expected = [min(data[i:j + 1]) for i, j in ranges.tolist()]
+    table = stacks.SparseTable(data, "min", typecode)
+    tree = stacks.SegmentTree(data, "min", typecode)
+    assert table.query_many(ranges) == tree.query_many(ranges) == expected
+    assert type(table.query_many(ranges)) is type(tree.query_many(ranges)) is list
+
+
+@pytest.mark.parametrize("d", [2, 4])
+def test_dary_heap_default_is_stable_with_uncomparable_items(stacks, d):
+    heap = stacks.DaryHeap(d=d)
+    for job in range(10):
+        heap.push(job % 2, {"job": job})
+    popped = [heap.pop() for _ in range(10)]
+    assert popped == [(0, {"job": j}) for j in range(0, 10, 2)] + [(1, {"job": j}) for j in range(1, 10, 2)]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_aggregate_stack_matches_reduce(stacks, compress):
+    import math
+
+    rng = random.Random(2)
+    stack, ref = stacks.AggregateStack(math.gcd, compress=compress), []
+    for _ in range(2000):
+        if ref and rng.random() < 0.45:
+            assert stack.pop() == ref.pop()
+        else:
+            v = rng.choice([2, 4, 6, 8, 9, 12])
+            stack.push(v)
+            ref.append(v)
+        if ref:
+            assert stack.query() == math.gcd(*ref)
+    if compress:
+        assert len(stack.agg_values) < len(stack.stack)
+
+
+def test_aggregate_stack_matrix_product(stacks):
+    np = pytest.importorskip("numpy")
+    mats = [np.array([[1, i], [0, 1]]) for i in range(1, 5)]
+    stack = stacks.AggregateStack(np.matmul, mats)
+    assert stack.query().tolist() == [[1, 10], [0, 1]]
+    stack.pop()
+    assert stack.query().tolist() == [[1, 6], [0, 1]]
+
+
+def test_maximal_rectangle_pool_matches_serial(stacks):
+    rng = random.Random(4)
+    matrix = [[int(rng.random() < 0.8) for _ in range(12)] for _ in range(60)]
+    serial = stacks.MonotonicStack.maximal_rectangle(matrix)
+    assert stacks.MonotonicStack.maximal_rectangle(matrix, processes=2, chunk_rows=7) == serial
+    assert stacks.MonotonicStack.maximal_rectangle(matrix, processes=None, chunk_rows=7) == serial
+
+
+@pytest.mark.parametrize("kwargs", [{"size": 0}, {"size": -1}, {"duration": 0}, {"duration": -0.5}])
+def test_sliding_windows_reject_non_positive_bounds(stacks, kwargs):
+    with pytest.raises(ValueError):
+        stacks.SlidingWindow(**kwargs)
+    with pytest.raises(ValueError):
+        stacks.SlidingAggregate(max, **kwargs)
+
+
+def test_min_stacks_match_reference(stacks):
+    rng = random.Random(20)
+    plain, compressed, minmax, ref = stacks.MinStack(), stacks.CompressedMinStack(), stacks.MinMaxStack(), []
+    for _ in range(3000):
+        if ref and rng.random() < 0.45:
+            v = ref.pop()
+            assert plain.pop() == compressed.pop() == minmax.pop() == v
+        else:
+            v = rng.randint(0, 9)
+            ref.append(v)
+            for s in (plain, compressed, minmax):
+                s.push(v)
+        if ref:
+            assert plain.peek() == compressed.peek() == ref[-1]
+            assert plain.get_min() == compressed.get_min() == minmax.get_min() == min(ref)
+            assert minmax.get_max() == max(ref)
+    assert len(compressed.min_values) <= len(ref)
+
+
+@pytest.mark.parametrize("cls", ["ArrayQueue", "PowerOfTwoArrayQueue", "RingDeque"])
+def test_queues_match_deque(stacks, cls):
+    from collections import deque
+
+    rng = random.Random(21)
+    q, ref = getattr(stacks, cls)(), deque()
+    for _ in range(3000):
+        op = rng.random()
+        if op < 0.4:
+            v = rng.randint(0, 99)
+            q.enqueue(v)
+            ref.append(v)
+        elif op < 0.5:
+            vs = [rng.randint(0, 99) for _ in range(rng.randint(0, 40))]
+            q.extend(vs)
+            ref.extend(vs)
+        elif ref and op < 0.9:
+            assert q.dequeue() == ref.popleft()
+        elif ref:
+            k = rng.randint(1, 40)
+            assert q.dequeue_many(k) == [ref.popleft() for _ in range(min(k, len(ref)))]
+        assert list(q) == list(ref) and len(q) == len(ref)
+        if cls == "PowerOfTwoArrayQueue":
+            assert q.capacity & (q.capacity - 1) == 0
+
+
+@pytest.mark.parametrize("maxlen", [None, 5])
+def test_ring_deque_matches_deque(stacks, maxlen):
+    from collections import deque
+
+    rng = random.Random(22)
+    d, ref = stacks.RingDeque(maxlen=maxlen, capacity=3), deque(maxlen=maxlen)
+    for _ in range(3000):
+        op = rng.randrange(6)
+        v = rng.randint(0, 99)
+        if op == 0:
+            d.push_back(v)
+            ref.append(v)
+        elif op == 1:
+            d.push_front(v)
+            ref.appendleft(v)
+        elif op == 2 and ref:
+            assert d.pop_front() == ref.popleft()
+        elif op == 3 and ref:
+            assert d.pop_back() == ref.pop()
+        elif op == 4:
+            n = rng.randint(-7, 7)
+            d.rotate(n)
+            ref.rotate(n)
+        elif ref:
+            i = rng.randrange(-len(ref), len(ref))
+            assert d[i] == ref[i]
+            d[i] = ref[i] = v
+        assert list(d) == list(ref)
+
+
+def test_concurrent_queue_delivers_everything_once(stacks):
+    import threading
+
+    q = stacks.ConcurrentArrayQueue(maxsize=16)
+    producers, per_producer = 4, 2000
+
+    def produce(base):
+        for i in range(0, per_producer, 10):
+            if i % 20:
+                q.put_many([base + j for j in range(i, i + 10)])
+            else:
+                for j in range(i, i + 10):
+                    q.put(base + j)
+
+    threads = [threading.Thread(target=produce, args=(p * per_producer,)) for p in range(producers)]
+    for t in threads:
+        t.start()
+    received = []
+    while len(received) < producers * per_producer:
+        received.extend(q.get_many(7, timeout=5))
+    for t in threads:
+        t.join()
+    assert sorted(received) == list(range(producers * per_producer))
+    with pytest.raises(queue.Empty):
+        q.get(timeout=0.01)
+
+
+def test_async_queue_delivers_in_order(stacks):
+    import asyncio
+
+    async def main():
+        q = stacks.AsyncArrayQueue(maxsize=8)
+
+        async def produce():
+            for i in range(0, 500, 5):
+                await q.put_many(list(range(i, i + 5)))
+            await q.put(None)
+
+        task = asyncio.create_task(produce())
+        received = []
+        while True:
+            items = await q.get_many(3)
+            received.extend(items)
+            if received and received[-1] is None:
+                break
+        await task
+        return received
+
+    assert asyncio.run(main()) == list(range(500)) + [None]
+
+
+@pytest.mark.parametrize("max_items", [0, -1])
+def test_concurrent_queues_reject_non_positive_batch(stacks, max_items):
+    import asyncio
+
+    q = stacks.ConcurrentArrayQueue(maxsize=4)
+    q.put_many([1, 2])
+    with pytest.raises(ValueError):
+        q.get_many(max_items)
+    assert q.get_many(4) == [1, 2]
+
+    async def main():
+        aq = stacks.AsyncArrayQueue(maxsize=4)
+        await aq.put_many([1, 2])
+        with pytest.raises(ValueError):
+            await aq.get_many(max_items)
+        return await aq.get_many(4)
+
+    assert asyncio.run(main()) == [1, 2]
+
+
+def test_shared_ring_buffer_zero_copy_peek(stacks):
+    ring = stacks.SharedRingBuffer(capacity=256)
+    try:
+        records = [bytes([i % 256]) * (i % 50) for i in range(300)]
+        out = []
+        for rec in records:
+            ring.put(rec, timeout=1)
+            view = ring.peek()
+            out.append(bytes(view))
+            view.release()
+            ring.release()
+        assert out == records
+        assert ring.try_get() is None
+    finally:
+        ring.close()
+        ring.unlink()
+
+
+def _ring_producer(stacks, name, count):
+    ring = stacks.SharedRingBuffer(name=name, create=False)
+    for i in range(count):
+        ring.put(i.to_bytes(4, "little") * (i % 40), timeout=10)
+    ring.close()
+
+
+def test_shared_ring_buffer_across_processes(stacks):
+    import multiprocessing
+
+    ring = stacks.SharedRingBuffer(capacity=1024)
+    try:
+        ctx = multiprocessing.get_context("fork")
+        producer = ctx.Process(target=_ring_producer, args=(stacks, ring.name, 5000))
+        producer.start()
+        for i in range(5000):
+            assert ring.get(timeout=10) == i.to_bytes(4, "little") * (i % 40)
+        producer.join(10)
+        assert producer.exitcode == 0
+    finally:
+        ring.close()
+        ring.unlink()
+
+
+@pytest.mark.parametrize("d", [2, 3, 4])
+@pytest.mark.parametrize("stable", [True, False])
+def test_dary_heap_matches_sorted(stacks, d, stable):
+    rng = random.Random(23)
+    data = [(rng.random(), i) for i in range(500)]
+    heap = stacks.DaryHeap(data[:200], d=d, stable=stable)
+    for p, i in data[200:]:
+        heap.push(p, i)
+    assert heap.peek() == min(data)
+    assert [heap.pop() for _ in range(len(data))] == sorted(data)
+    assert heap.is_empty()
+
+
+def test_indexed_heap_updates_match_reference(stacks):
+    rng = random.Random(24)
+    heap = stacks.IndexedHeap(d=4)
+    live = {}
+    for step in range(3000):
+        op = rng.random()
+        if op < 0.4 or not live:
+            h = heap.push(rng.randint(0, 50), step)
+            live[h] = h.priority
+        elif op < 0.6:
+            h = rng.choice(list(live))
+            live[h] = rng.randint(0, 50)
+            heap.update(h, live[h])
+        elif op < 0.7:
+            h = rng.choice(list(live))
+            live[h] = max(0, live[h] - rng.randint(0, 5))
+            heap.decrease_key(h, live[h])
+        elif op < 0.8:
+            h = rng.choice(list(live))
+            assert heap.remove(h) == (live.pop(h), h.item)
+        else:
+            best = min(live, key=lambda h: (live[h], h.seq))
+            assert heap.pop() == (live.pop(best), best.item)
+        assert len(heap) == len(live)
+
+
+def _brute_largest_rectangle(heights):
+    return max([min(heights[i:j + 1]) * (j - i + 1) for i in range(len(heights)) for j in range(i, len(heights))] or [0])
+
+
+def test_largest_rectangle_matches_brute_force(stacks):
+    ms = stacks.MonotonicStack
+    rng = random.Random(25)
+    for _ in range(500):
+        heights = [rng.randint(0, 6) for _ in range(rng.randint(0, 12))]
+        expected = _brute_largest_rectangle(heights)
+        area, left, right, height = ms.largest_rectangle(heights)
+        assert area == ms.largest_rectangle_area(heights) == expected
+        if area:
+            assert min(heights[left:right + 1]) >= height and height * (right - left + 1) == area
+
+
+def test_maximal_rectangle_matches_brute_force(stacks):
+    ms = stacks.MonotonicStack
+    rng = random.Random(26)
+    for _ in range(300):
+        rows, cols = rng.randint(1, 6), rng.randint(1, 6)
+        matrix = [[int(rng.random() < 0.7) for _ in range(cols)] for _ in range(rows)]
+        best = 0
+        for top in range(rows):
+            for bottom in range(top, rows):
+                heights = [int(all(matrix[r][c] for r in range(top, bottom + 1))) * (bottom - top + 1) for c in range(cols)]
+                best = max(best, _brute_largest_rectangle(heights))
+        area, rect = ms.maximal_rectangle(matrix)
+        assert area == best
+        assert ms.maximal_rectangle(["".join(map(str, row)) + "\n" for row in matrix]) == (area, rect)
+        if area:
+            top, left, bottom, right = rect
+            assert (bottom - top + 1) * (right - left + 1) == area
+            assert all(matrix[r][c] for r in range(top, bottom + 1) for c in range(left, right + 1))
+
+
+@pytest.mark.parametrize("dtype", ["int64", "uint8", "float64"])
+def test_monotonic_stack_batch_matches_per_row(stacks, dtype):
+    np = pytest.importorskip("numpy")
+    ms = stacks.MonotonicStack
+    rng = np.random.default_rng(27)
+    for block_rows in (1, 3, 4096):
+        for n in (0, 1, 2, 17):
+            matrix = rng.integers(0, 6, size=(7, n)).astype(dtype)
+            rows = matrix.tolist()
+            assert ms.next_greater_element_batch(matrix, block_rows).tolist() == [ms.next_greater_element(r) for r in rows]
+            assert ms.daily_temperatures_batch(matrix, block_rows).tolist() == [ms.daily_temperatures(r) for r in rows]
+            assert ms.largest_rectangle_area_batch(matrix, block_rows).tolist() == [ms.largest_rectangle_area(r) for r in rows]
+
+
+def test_sliding_windows_match_brute_force(stacks):
+    import math
+    import operator
+
+    rng = random.Random(28)
+    data = [rng.randint(-20, 20) for _ in range(400)]
+    for k in (1, 2, 5, 33):
+        windows = [data[i - k + 1:i + 1] for i in range(k - 1, len(data))]
+        assert list(stacks.MonotonicQueue.sliding_window_stream(iter(data), k)) == [(max(w), min(w)) for w in windows]
+        assert stacks.MonotonicQueue.sliding_window_maximum(data, k) == [max(w) for w in windows]
+        for op in (operator.add, math.gcd, min):
+            expected = []
+            for w in windows:
+                acc = w[0]
+                for x in w[1:]:
+                    acc = op(acc, x)
+                expected.append(acc)
+            assert list(stacks.SlidingAggregate.stream(data, op, k)) == expected
+    # 字符串拼接不满足交换律，检查聚合顺序
+    assert list(stacks.SlidingAggregate.stream("abcdef", operator.add, 3)) == ["abc", "bcd", "cde", "def"]
+
+    timestamps = sorted(rng.uniform(0, 100) for _ in range(len(data)))
+    window = stacks.SlidingWindow(duration=7.5)
+    aggregate = stacks.SlidingAggregate(max, duration=7.5)
+    for i, (t, x) in enumerate(zip(timestamps, data)):
+        inside = [y for s, y in zip(timestamps[:i + 1], data) if s > t - 7.5]
+        assert window.push(x, t) == (max(inside), min(inside))
+        assert aggregate.push(x, t) == max(inside)
+
+
+@pytest.mark.parametrize("kind", ["min", "max"])
+@pytest.mark.parametrize("typecode", [None, "q"])
+def test_range_indexes_match_slices(stacks, kind, typecode):
+    op = min if kind == "min" else max
+    rng = random.Random(29)
+    for n in (1, 2, 3, 31, 64, 100):
+        data = [rng.randint(-50, 50) for _ in range(n)]
+        ranges = [(i, rng.randint(i, n - 1)) for i in (rng.randrange(n) for _ in range(50))]
+        table = stacks.SparseTable(data, kind, typecode)
+        tree = stacks.SegmentTree(data, kind, typecode)
+        expected = [op(data[i:j + 1]) for i, j in ranges]
+        assert table.query_many(ranges) == tree.query_many(ranges) == expected
+        updates = [(rng.randrange(n), rng.randint(-50, 50)) for _ in range(30)]
+        tree.update_many(updates)
+        for index, value in updates:
+            data[index] = value
+        assert tree.query_many(ranges) == [op(data[i:j + 1]) for i, j in ranges]
+        with pytest.raises(IndexError):
+            table.query(0, n)